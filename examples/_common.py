@@ -0,0 +1,235 @@
+# Copyright 2026 Mengzhao Wang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helpers for the example scripts."""
+
+import logging
+import os
+import sys
+import time
+from typing import Optional
+
+from advlog import ensure_utf8_stdio
+from advlog.handlers import create_buffered_stream_handler
+
+# Banner rules built once at import instead of "=" * 80 at every print site
+BAR80 = "=" * 80
+BAR70 = "=" * 70
+DASH80 = "-" * 80
+
+# Handlers are reused per formatter so repeated bind() calls don't allocate
+# a new handler (and stream lock) for every example.
+_HANDLER_CACHE = {}
+
+# Set ADVLOG_FAST_EXAMPLES=1 to skip the simulated-work sleeps, so the
+# examples stress the logging hot path instead of waiting on timers.
+FAST_EXAMPLES = bool(os.getenv("ADVLOG_FAST_EXAMPLES"))
+
+
+def pace(seconds: float) -> None:
+    """Sleep to simulate per-step work, unless fast mode is enabled.
+
+    Args:
+        seconds: Simulated work duration
+    """
+    if not FAST_EXAMPLES:
+        time.sleep(seconds)
+
+
+class ThrottledProgress:
+    """Coalesce per-item progress advances into occasional renders.
+
+    Calling ``progress.update(task, advance=1)`` on every iteration drives a
+    Rich re-render (and a terminal write) per item. This wrapper accumulates
+    advances locally and only pushes them when the bar would visibly move
+    (``min_delta`` of the total) or ``min_interval_s`` has elapsed, cutting
+    O(N) renders down to roughly one per visible percentage step.
+
+    Usage:
+        throttled = ThrottledProgress(progress, task, total=1000)
+        for item in items:
+            work(item)
+            throttled.tick()
+        throttled.flush()
+    """
+
+    def __init__(self, progress, task_id, total, min_delta: float = 0.01, min_interval_s: float = 0.05):
+        """Initialize the throttle for one task.
+
+        Args:
+            progress: Progress tracker owning the task
+            task_id: Task to advance
+            total: Task total, used to detect visible movement
+            min_delta: Fraction of total that warrants a render
+            min_interval_s: Maximum seconds between renders
+        """
+        self._progress = progress
+        self._task_id = task_id
+        self._total = total
+        self._min_delta = min_delta
+        self._min_interval_s = min_interval_s
+        self._accum = 0
+        self._last_flush = time.monotonic()
+
+    def tick(self, n: int = 1) -> None:
+        """Accumulate an advance, rendering only at visible boundaries.
+
+        Args:
+            n: Amount to advance by
+        """
+        self._accum += n
+        now = time.monotonic()
+        if self._accum / self._total >= self._min_delta or now - self._last_flush >= self._min_interval_s:
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None) -> None:
+        """Push any pending advance to the progress bar.
+
+        Call once after the loop so the bar lands exactly on its total.
+
+        Args:
+            now: Current monotonic time, if the caller already has it
+        """
+        if self._accum:
+            self._progress.update(self._task_id, advance=self._accum)
+            self._accum = 0
+        self._last_flush = time.monotonic() if now is None else now
+
+
+class Pacer:
+    """Deadline-based pacing for demo loops.
+
+    Per-iteration ``time.sleep(dt)`` accumulates timer jitter - each sleep
+    can overshoot by a scheduler tick (15.6ms default resolution on
+    Windows), so N sleeps drift well past ``N * dt``. Sleeping toward an
+    absolute deadline absorbs the jitter: each wait is sized by whatever
+    time remains for the current iteration, so total runtime stays at
+    ``N * dt`` and there is at most one wakeup per checkpoint.
+
+    Usage:
+        pacer = Pacer(per_iter=0.05)
+        for item in items:
+            work(item)
+            pacer.wait()  # sleeps until t_start + iterations * per_iter
+    """
+
+    def __init__(self, per_iter: float):
+        """Start the pacing clock.
+
+        Args:
+            per_iter: Target seconds per iteration
+        """
+        self._per_iter = per_iter
+        self._ticks = 0
+        self._t_start = time.perf_counter()
+
+    def wait(self) -> None:
+        """Sleep until this iteration's deadline, if it is still ahead."""
+        self._ticks += 1
+        slack = self._t_start + self._ticks * self._per_iter - time.perf_counter()
+        if slack > 0.001:
+            time.sleep(slack)
+
+
+class LineBuffer:
+    """Accumulate console fragments and emit them as a single log call.
+
+    Each ``console.log`` pays Rich's full render path (timestamp, caller
+    location, markup, segmentation). Collecting the fragments for one
+    logical event and flushing them together collapses several renders
+    into one.
+
+    Usage:
+        buf = LineBuffer()
+        buf.append("step done")
+        buf.append("cache warm")
+        buf.flush(progress.console)  # one console.log
+    """
+
+    def __init__(self):
+        self._parts = []
+
+    def append(self, text: str) -> None:
+        """Buffer one fragment.
+
+        Args:
+            text: Fragment to include in the next flush
+        """
+        self._parts.append(text)
+
+    def flush(self, console) -> None:
+        """Emit buffered fragments as one console.log call, if any.
+
+        Args:
+            console: Rich console to log to
+        """
+        if self._parts:
+            console.log(" ".join(self._parts))
+            self._parts.clear()
+
+
+def ensure_utf8() -> None:
+    """Switch stdout/stderr to UTF-8 on Windows consoles.
+
+    Delegates to advlog.ensure_utf8_stdio(), which reconfigures the
+    existing streams once and no-ops on subsequent calls.
+    """
+    ensure_utf8_stdio()
+
+
+def fast_mode(disable_caller_info: bool = False) -> None:
+    """Turn off per-record bookkeeping that the demos never display.
+
+    Disables collection of thread, process and multiprocessing info on every
+    LogRecord. Caller introspection (the stack walk behind filename/lineno/
+    funcName) stays on by default because most demos render the source
+    location; pass disable_caller_info=True for demos that don't.
+
+    Args:
+        disable_caller_info: Also skip the findCaller() stack walk
+    """
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if disable_caller_info:
+        logging._srcfile = None
+
+
+def bind(name: str, formatter: logging.Formatter, level: int = logging.DEBUG) -> logging.Logger:
+    """Configure and return a stdout logger for one example.
+
+    Replaces the getLogger/setLevel/clear/StreamHandler/setFormatter/
+    addHandler boilerplate repeated across the demos.
+
+    Args:
+        name: Logger name
+        formatter: Formatter for the stdout handler
+        level: Logger level
+
+    Returns:
+        Configured logger
+    """
+    handler = _HANDLER_CACHE.get(id(formatter))
+    if handler is None:
+        handler = create_buffered_stream_handler(sys.stdout, formatter=formatter)
+        _HANDLER_CACHE[id(formatter)] = handler
+
+    logger = logging.getLogger(name)
+    logger.setLevel(level)
+    # Single-slot assignment replaces clear() + addHandler() (two trips
+    # through the handler lock) with one, and propagate=False skips the
+    # walk up the logger tree on every record.
+    logger.handlers = [handler]
+    logger.propagate = False
+    return logger
@@ -16,12 +16,9 @@
 
 import logging
 import sys
+import traceback
 
-if sys.platform == "win32":
-    import codecs
-
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+from _common import BAR80, bind, ensure_utf8, fast_mode
 
 from advlog.core.formatter import (
     AlignedFormatter,
@@ -31,12 +28,12 @@ from advlog.core.formatter import (
     create_aligned_formatter,
 )
 
+ensure_utf8()
+
 
 def example1_standard_aligned():
     """Example 1: Standard aligned format"""
-    print("\n" + "=" * 80)
-    print("Example 1: Standard aligned format")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 1: Standard aligned format\n{BAR80}")
 
     formatter = AlignedFormatter(
         time_width=12,
@@ -47,13 +44,7 @@ def example1_standard_aligned():
         align_location="right",
     )
 
-    logger = logging.getLogger("aligned_demo1")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("aligned_demo1", formatter)
 
     # Logs of different lengths
     logger.debug("Debug information")
@@ -64,9 +55,7 @@ def example1_standard_aligned():
 
 def example2_table_format():
     """Example 2: Table format"""
-    print("\n" + "=" * 80)
-    print("Example 2: Table format (like a data table)")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 2: Table format (like a data table)\n{BAR80}")
 
     formatter = TableFormatter(
         time_width=12,
@@ -74,25 +63,22 @@ def example2_table_format():
         location_width=35,
     )
 
-    logger = logging.getLogger("table_demo")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("table_demo", formatter)
 
     def process_data():
-        logger.info("Starting data processing")
-        logger.debug("Loading configuration file")
+        info, debug = logger.info, logger.debug
+        info("Starting data processing")
+        debug("Loading configuration file")
 
     def validate_input():
-        logger.info("Validating input parameters")
-        logger.warning("Parameters may be incomplete")
+        info, warning = logger.info, logger.warning
+        info("Validating input parameters")
+        warning("Parameters may be incomplete")
 
     def save_result():
-        logger.info("Saving processed results")
-        logger.error("Insufficient disk space")
+        info, error = logger.info, logger.error
+        info("Saving processed results")
+        error("Insufficient disk space")
 
     process_data()
     validate_input()
@@ -101,33 +87,24 @@ def example2_table_format():
 
 def example3_compact_format():
     """Example 3: Compact format"""
-    print("\n" + "=" * 80)
-    print("Example 3: Compact format (recommended for development)")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 3: Compact format (recommended for development)\n{BAR80}")
 
     formatter = CompactFormatter(location_width=30)
 
-    logger = logging.getLogger("compact_demo")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("compact_demo", formatter)
 
     def api_handler():
-        logger.debug("Receiving API request")
-        logger.info("Processing request")
-        logger.warning("Request taking too long")
+        debug, info, warning = logger.debug, logger.info, logger.warning
+        debug("Receiving API request")
+        info("Processing request")
+        warning("Request taking too long")
 
     api_handler()
 
 
 def example4_column_format():
     """Example 4: Column format"""
-    print("\n" + "=" * 80)
-    print("Example 4: Column format (custom columns)")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 4: Column format (custom columns)\n{BAR80}")
 
     formatter = ColumnFormatter(
         columns=["time", "level", "name", "location", "message"],
@@ -140,13 +117,7 @@ def example4_column_format():
         },
     )
 
-    logger = logging.getLogger("column_demo")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("column_demo", formatter)
 
     logger.info("Log with logger name included")
     logger.warning("Can display more column information")
@@ -154,9 +125,7 @@ def example4_column_format():
 
 def example5_different_alignments():
     """Example 5: Different alignment methods"""
-    print("\n" + "=" * 80)
-    print("Example 5: Different alignment methods")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 5: Different alignment methods\n{BAR80}")
 
     print("\n--- Left alignment ---")
     formatter_left = AlignedFormatter(
@@ -168,52 +137,31 @@ def example5_different_alignments():
         align_location="left",
     )
 
-    logger_left = logging.getLogger("left_align")
-    logger_left.setLevel(logging.DEBUG)
-    logger_left.handlers.clear()
-    handler_left = logging.StreamHandler(sys.stdout)
-    handler_left.setFormatter(formatter_left)
-    logger_left.addHandler(handler_left)
+    logger_left = bind("left_align", formatter_left)
 
     logger_left.info("Left aligned format")
     logger_left.warning("All fields are left aligned")
 
     print("\n--- Right alignment ---")
-    formatter_right = AlignedFormatter(
-        time_width=12,
-        level_width=10,
-        location_width=30,
+    formatter_right = formatter_left.clone(
         align_time="right",
         align_level="right",
         align_location="right",
     )
 
-    logger_right = logging.getLogger("right_align")
-    logger_right.setLevel(logging.DEBUG)
-    logger_right.handlers.clear()
-    handler_right = logging.StreamHandler(sys.stdout)
-    handler_right.setFormatter(formatter_right)
-    logger_right.addHandler(handler_right)
+    logger_right = bind("right_align", formatter_right)
 
     logger_right.info("Right aligned format")
     logger_right.warning("All fields are right aligned")
 
     print("\n--- Center alignment ---")
-    formatter_center = AlignedFormatter(
-        time_width=12,
-        level_width=10,
-        location_width=30,
+    formatter_center = formatter_left.clone(
         align_time="center",
         align_level="center",
         align_location="center",
     )
 
-    logger_center = logging.getLogger("center_align")
-    logger_center.setLevel(logging.DEBUG)
-    logger_center.handlers.clear()
-    handler_center = logging.StreamHandler(sys.stdout)
-    handler_center.setFormatter(formatter_center)
-    logger_center.addHandler(handler_center)
+    logger_center = bind("center_align", formatter_center)
 
     logger_center.info("Center aligned format")
     logger_center.warning("All fields are center aligned")
@@ -221,9 +169,7 @@ def example5_different_alignments():
 
 def example6_custom_widths():
     """Example 6: Custom field widths"""
-    print("\n" + "=" * 80)
-    print("Example 6: Custom field widths")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 6: Custom field widths\n{BAR80}")
 
     print("\n--- Narrow width (compact) ---")
     formatter_narrow = AlignedFormatter(
@@ -232,29 +178,19 @@ def example6_custom_widths():
         location_width=20,
     )
 
-    logger_narrow = logging.getLogger("narrow")
-    logger_narrow.setLevel(logging.DEBUG)
-    logger_narrow.handlers.clear()
-    handler_narrow = logging.StreamHandler(sys.stdout)
-    handler_narrow.setFormatter(formatter_narrow)
-    logger_narrow.addHandler(handler_narrow)
+    logger_narrow = bind("narrow", formatter_narrow)
 
     logger_narrow.info("Compact format")
     logger_narrow.warning("Narrow width")
 
     print("\n--- Wide width (loose) ---")
-    formatter_wide = AlignedFormatter(
+    formatter_wide = formatter_narrow.clone(
         time_width=15,
         level_width=12,
         location_width=45,
     )
 
-    logger_wide = logging.getLogger("wide")
-    logger_wide.setLevel(logging.DEBUG)
-    logger_wide.handlers.clear()
-    handler_wide = logging.StreamHandler(sys.stdout)
-    handler_wide.setFormatter(formatter_wide)
-    logger_wide.addHandler(handler_wide)
+    logger_wide = bind("wide", formatter_wide)
 
     logger_wide.info("Loose format")
     logger_wide.warning("Wide width, easier to read")
@@ -262,9 +198,7 @@ def example6_custom_widths():
 
 def example7_with_without_fields():
     """Example 7: Selective field display"""
-    print("\n" + "=" * 80)
-    print("Example 7: Selective field display")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 7: Selective field display\n{BAR80}")
 
     print("\n--- Only show level and message ---")
     formatter_minimal = AlignedFormatter(
@@ -273,12 +207,7 @@ def example7_with_without_fields():
         show_location=False,
     )
 
-    logger_minimal = logging.getLogger("minimal")
-    logger_minimal.setLevel(logging.DEBUG)
-    logger_minimal.handlers.clear()
-    handler_minimal = logging.StreamHandler(sys.stdout)
-    handler_minimal.setFormatter(formatter_minimal)
-    logger_minimal.addHandler(handler_minimal)
+    logger_minimal = bind("minimal", formatter_minimal)
 
     logger_minimal.info("Minimal format")
     logger_minimal.warning("Only show necessary information")
@@ -295,12 +224,7 @@ def example7_with_without_fields():
         show_location=True,
     )
 
-    logger_full = logging.getLogger("full_display")
-    logger_full.setLevel(logging.DEBUG)
-    logger_full.handlers.clear()
-    handler_full = logging.StreamHandler(sys.stdout)
-    handler_full.setFormatter(formatter_full)
-    logger_full.addHandler(handler_full)
+    logger_full = bind("full_display", formatter_full)
 
     logger_full.info("Full format")
     logger_full.warning("Show all fields")
@@ -308,9 +232,7 @@ def example7_with_without_fields():
 
 def example8_real_world_scenario():
     """Example 8: Real-world scenario"""
-    print("\n" + "=" * 80)
-    print("Example 8: Real-world scenario - Web application logs")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 8: Real-world scenario - Web application logs\n{BAR80}")
 
     formatter = TableFormatter(
         time_width=12,
@@ -318,86 +240,72 @@ def example8_real_world_scenario():
         location_width=40,
     )
 
-    logger = logging.getLogger("webapp")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("webapp", formatter)
 
     def handle_request():
-        logger.info("Received HTTP request: GET /api/users")
-        logger.debug("Parsing request parameters")
+        info, debug = logger.info, logger.debug
+        info("Received HTTP request: GET /api/users")
+        debug("Parsing request parameters")
         validate_auth()
         query_database()
-        logger.info("Returning response: 200 OK")
+        info("Returning response: 200 OK")
 
     def validate_auth():
-        logger.debug("Validating user token")
-        logger.info("User authentication successful")
+        debug, info = logger.debug, logger.info
+        debug("Validating user token")
+        info("User authentication successful")
 
     def query_database():
-        logger.debug("Executing database query")
-        logger.warning("Query took 1.2s, approaching threshold")
-        logger.info("Query completed, returning 150 records")
+        debug, warning, info = logger.debug, logger.warning, logger.info
+        debug("Executing database query")
+        warning("Query took 1.2s, approaching threshold")
+        info("Query completed, returning 150 records")
 
     handle_request()
 
 
 def example9_factory_function():
     """Example 9: Using factory function to create"""
-    print("\n" + "=" * 80)
-    print("Example 9: Using factory function to create formatter")
-    print("=" * 80)
+    print(f"\n{BAR80}\nExample 9: Using factory function to create formatter\n{BAR80}")
 
-    # Create different styles
+    # Create all styles up front, then reuse one logger/handler pair and
+    # just swap the formatter per style
     styles = ["standard", "table", "compact"]
+    formatters = {style: create_aligned_formatter(style) for style in styles}
+
+    logger = bind("factory_demo", formatters[styles[0]], level=logging.INFO)
+    handler = logger.handlers[0]
 
     for style in styles:
         print(f"\n--- {style.upper()} style ---")
 
-        formatter = create_aligned_formatter(style)
+        handler.setFormatter(formatters[style])
+        logger.info("This is a %s style log", style)
+        logger.warning("%s style warning message", style)
+
 
-        logger = logging.getLogger(f"factory_{style}")
-        logger.setLevel(logging.INFO)
-        logger.handlers.clear()
+# Run all examples
+if __name__ == "__main__":
+    fast_mode()
 
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+    print(f"{BAR80}\n🎨 Log aligned formatting feature demonstration\n{BAR80}")
 
-        logger.info(f"This is a {style} style log")
-        logger.warning(f"{style} style warning message")
+    # Direct calls instead of a dispatch list; an uncaught failure is
+    # reported once via the excepthook instead of per-call try/except.
+    def _report_failure(exc_type, exc, tb):
+        print(f"\n[Error] demo aborted: {exc}")
+        traceback.print_exception(exc_type, exc, tb)
 
+    sys.excepthook = _report_failure
 
-# Run all examples
-if __name__ == "__main__":
-    print("=" * 80)
-    print("🎨 Log aligned formatting feature demonstration")
-    print("=" * 80)
-
-    examples = [
-        example1_standard_aligned,
-        example2_table_format,
-        example3_compact_format,
-        example4_column_format,
-        example5_different_alignments,
-        example6_custom_widths,
-        example7_with_without_fields,
-        example8_real_world_scenario,
-        example9_factory_function,
-    ]
-
-    for example in examples:
-        try:
-            example()
-        except Exception as e:
-            print(f"\n[Error] {example.__name__}: {e}")
-            import traceback
-
-            traceback.print_exc()
-
-    print("\n" + "=" * 80)
-    print("✅ All examples completed!")
-    print("=" * 80)
+    example1_standard_aligned()
+    example2_table_format()
+    example3_compact_format()
+    example4_column_format()
+    example5_different_alignments()
+    example6_custom_widths()
+    example7_with_without_fields()
+    example8_real_world_scenario()
+    example9_factory_function()
+
+    print(f"\n{BAR80}\n✅ All examples completed!\n{BAR80}")
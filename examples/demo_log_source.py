@@ -14,25 +14,38 @@
 
 """Demonstration of log source information display - Shows function name, file name, line number"""
 
+import atexit
+import logging
+import queue
 import sys
+import traceback
+from logging.handlers import QueueHandler, QueueListener
 
-if sys.platform == "win32":
-    import codecs
-
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
-
-import logging
+from _common import BAR70, bind, ensure_utf8
 
 from advlog.core import AdvancedLogger, LoggerConfig
 from advlog.core.formatter import PlainFormatter
 
+ensure_utf8()
+
+# pathname -> "last two levels" cache for example 9; repeated records from
+# the same file skip the replace/split/join work
+_SHORT_PATH_CACHE = {}
+
+
+def _short_path(pathname):
+    """Shorten a pathname to its last two components, with caching."""
+    short = _SHORT_PATH_CACHE.get(pathname)
+    if short is None:
+        parts = pathname.replace("\\", "/").split("/")
+        short = "/".join(parts[-2:]) if len(parts) >= 2 else pathname
+        _SHORT_PATH_CACHE[pathname] = short
+    return short
+
 
 def example1_basic_source_info():
     """Example 1: Basic source information display"""
-    print("\n" + "=" * 70)
-    print("Example 1: Display file name and line number")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 1: Display file name and line number\n{BAR70}")
 
     # Create custom formatter with source information
     formatter = PlainFormatter(
@@ -40,15 +53,7 @@ def example1_basic_source_info():
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    # Create logger
-    logger = logging.getLogger("source_demo1")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    # Add console handler
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("source_demo1", formatter)
 
     # Test log
     logger.info("This log will show file name and line number")
@@ -58,19 +63,11 @@ def example1_basic_source_info():
 
 def example2_function_name():
     """Example 2: Display function name"""
-    print("\n" + "=" * 70)
-    print("Example 2: Display function name")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 2: Display function name\n{BAR70}")
 
     formatter = PlainFormatter(fmt="%(asctime)s | %(levelname)-8s | [%(funcName)s] | %(message)s", datefmt="%H:%M:%S")
 
-    logger = logging.getLogger("source_demo2")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("source_demo2", formatter)
 
     def inner_function():
         logger.info("This log comes from inner_function")
@@ -85,69 +82,46 @@ def example2_function_name():
 
 def example3_full_path():
     """Example 3: Display full path information"""
-    print("\n" + "=" * 70)
-    print("Example 3: Display full path information")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 3: Display full path information\n{BAR70}")
 
     formatter = PlainFormatter(
         fmt="%(asctime)s | %(levelname)-8s | [%(pathname)s:%(lineno)d:%(funcName)s] | %(message)s",
         datefmt="%H:%M:%S",
     )
 
-    logger = logging.getLogger("source_demo3")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("source_demo3", formatter)
 
     logger.info("Display full path, line number, and function name")
 
 
 def example4_module_info():
     """Example 4: Display module information"""
-    print("\n" + "=" * 70)
-    print("Example 4: Display module information")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 4: Display module information\n{BAR70}")
 
     formatter = PlainFormatter(
         fmt="%(asctime)s | %(name)s | %(module)s.%(funcName)s:%(lineno)d | %(levelname)s | %(message)s",
         datefmt="%H:%M:%S",
     )
 
-    logger = logging.getLogger("source_demo4")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("source_demo4", formatter)
 
     logger.info("Display module name, function name, and line number")
 
 
 def example5_compact_format():
     """Example 5: Compact format (suitable for development environment)"""
-    print("\n" + "=" * 70)
-    print("Example 5: Compact format (recommended for development)")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 5: Compact format (recommended for development)\n{BAR70}")
 
     # Compact but complete information format
     formatter = PlainFormatter(fmt="[%(levelname).1s] %(filename)s:%(lineno)d:%(funcName)s() | %(message)s")
 
-    logger = logging.getLogger("source_demo5")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    logger = bind("source_demo5", formatter)
 
     def process_data():
-        logger.debug("Starting to process data")
-        logger.info("Data processing in progress...")
-        logger.warning("Abnormal values detected")
+        debug, info, warning = logger.debug, logger.info, logger.warning
+        debug("Starting to process data")
+        info("Data processing in progress...")
+        warning("Abnormal values detected")
 
     def validate_input():
         logger.info("Validating input")
@@ -158,9 +132,7 @@ def example5_compact_format():
 
 def example6_with_rich():
     """Example 6: Use Rich to display source information (colored)"""
-    print("\n" + "=" * 70)
-    print("Example 6: Rich colored source information")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 6: Rich colored source information\n{BAR70}")
 
     from advlog.handlers.console import create_console_handler
 
@@ -173,8 +145,8 @@ def example6_with_rich():
 
     logger = logging.getLogger("source_demo6")
     logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-    logger.addHandler(handler)
+    logger.handlers = [handler]
+    logger.propagate = False
 
     def api_handler():
         logger.info("API request processing - Rich will automatically show file name and line number")
@@ -192,17 +164,17 @@ def example6_with_rich():
 
 def example7_file_output_with_source():
     """Example 7: File output with source information"""
-    print("\n" + "=" * 70)
-    print("Example 7: File output with source information")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 7: File output with source information\n{BAR70}")
 
     from advlog.handlers.file import create_file_handler
 
-    # Create file handler
+    # Create file handler; batch writes so each record doesn't pay its own
+    # syscall (flushes every 64 records, on ERROR, and at close)
     handler = create_file_handler(
         log_file="logs/source_info.log",
         mode="w",  # Overwrite mode
         log_level=logging.DEBUG,
+        batch_capacity=64,
     )
 
     # Custom format - includes detailed source information
@@ -212,15 +184,14 @@ def example7_file_output_with_source():
     )
     handler.setFormatter(formatter)
 
-    logger = logging.getLogger("source_demo7")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-    logger.addHandler(handler)
-
     # Also add console output
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    logger = logging.getLogger("source_demo7")
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [handler, console_handler]
+    logger.propagate = False
 
     def main_process():
         logger.info("Starting main process")
@@ -238,9 +209,7 @@ def example7_file_output_with_source():
 
 def example8_advanced_logger_with_source():
     """Example 8: Use AdvancedLogger to configure source information"""
-    print("\n" + "=" * 70)
-    print("Example 8: AdvancedLogger with source information")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 8: AdvancedLogger with source information\n{BAR70}")
 
     # Method 1: Configure through LoggerConfig
     config = LoggerConfig(
@@ -266,11 +235,11 @@ def example8_advanced_logger_with_source():
     def calculate():
         logger.debug("Starting calculation")
         result = 42
-        logger.info(f"Calculation result: {result}")
+        logger.info("Calculation result: %s", result)
         return result
 
     def save_result(data):
-        logger.info(f"Saving result: {data}")
+        logger.info("Saving result: %s", data)
         logger.debug("Write completed")
 
     result = calculate()
@@ -281,34 +250,22 @@ def example8_advanced_logger_with_source():
 
 def example9_custom_source_formatter():
     """Example 9: Custom source information formatter"""
-    print("\n" + "=" * 70)
-    print("Example 9: Custom source information formatter")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 9: Custom source information formatter\n{BAR70}")
 
     class SourceFormatter(logging.Formatter):
         """Custom formatter, intelligently displays source information"""
 
-        def format(self, record):
-            # Short path name (only show last two levels)
-            path_parts = record.pathname.replace("\\", "/").split("/")
-            short_path = "/".join(path_parts[-2:]) if len(path_parts) >= 2 else record.pathname
-
-            # Custom format
-            record.short_path = short_path
-            record.location = f"{short_path}:{record.lineno}:{record.funcName}()"
+        def __init__(self):
+            # Parse the format string once here; the old version built a
+            # fresh logging.Formatter for every record
+            super().__init__("%(asctime)s | %(levelname)-8s | [%(location)s] | %(message)s", datefmt="%H:%M:%S")
 
-            # Use custom fields
-            fmt = "%(asctime)s | %(levelname)-8s | [%(location)s] | %(message)s"
-            formatter = logging.Formatter(fmt, datefmt="%H:%M:%S")
-            return formatter.format(record)
-
-    logger = logging.getLogger("source_demo9")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
+        def format(self, record):
+            # Short path name (only show last two levels), cached per path
+            record.location = f"{_short_path(record.pathname)}:{record.lineno}:{record.funcName}()"
+            return super().format(record)
 
-    handler = logging.StreamHandler(sys.stdout)
-    handler.setFormatter(SourceFormatter())
-    logger.addHandler(handler)
+    logger = bind("source_demo9", SourceFormatter())
 
     def test_function():
         logger.info("Using custom formatter")
@@ -319,9 +276,7 @@ def example9_custom_source_formatter():
 
 def example10_production_format():
     """Example 10: Production environment recommended format"""
-    print("\n" + "=" * 70)
-    print("Example 10: Production environment recommended format")
-    print("=" * 70)
+    print(f"\n{BAR70}\nExample 10: Production environment recommended format\n{BAR70}")
 
     # Console: concise format
     console_formatter = PlainFormatter(fmt="%(asctime)s | %(levelname).1s | %(name)s | %(message)s", datefmt="%H:%M:%S")
@@ -332,27 +287,34 @@ def example10_production_format():
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
-    logger = logging.getLogger("production")
-    logger.setLevel(logging.DEBUG)
-    logger.handlers.clear()
-
     # Console handler (concise)
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)  # Console only shows INFO and above
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     # File handler (detailed)
     from advlog.handlers.file import create_file_handler
 
     file_handler = create_file_handler(log_file="logs/production.log", mode="w", log_level=logging.DEBUG)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    # Callers only pay for an enqueue; formatting and I/O for both handlers
+    # happen on the listener's background thread
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    logger = logging.getLogger("production")
+    logger.setLevel(logging.DEBUG)
+    logger.handlers = [QueueHandler(log_queue)]
+    logger.propagate = False
 
     def api_endpoint():
-        logger.debug("DEBUG information (only in file)")
-        logger.info("INFO information (console + file)")
-        logger.warning("WARNING information (console + file)")
+        debug, info, warning = logger.debug, logger.info, logger.warning
+        debug("DEBUG information (only in file)")
+        info("INFO information (console + file)")
+        warning("WARNING information (console + file)")
 
     api_endpoint()
 
@@ -362,35 +324,28 @@ def example10_production_format():
 
 # Run all examples
 if __name__ == "__main__":
-    print("=" * 70)
-    print("🔍 Log source information display feature demonstration")
-    print("=" * 70)
-
-    examples = [
-        example1_basic_source_info,
-        example2_function_name,
-        example3_full_path,
-        example4_module_info,
-        example5_compact_format,
-        example6_with_rich,
-        example7_file_output_with_source,
-        example8_advanced_logger_with_source,
-        example9_custom_source_formatter,
-        example10_production_format,
-    ]
-
-    for example in examples:
-        try:
-            example()
-        except Exception as e:
-            print(f"\n[Error] {example.__name__}: {e}")
-            import traceback
-
-            traceback.print_exc()
-
-    print("\n" + "=" * 70)
-    print("✅ All examples completed!")
-    print("=" * 70)
+    print(f"{BAR70}\n🔍 Log source information display feature demonstration\n{BAR70}")
+
+    # Direct calls instead of a dispatch list; an uncaught failure is
+    # reported once via the excepthook instead of per-call try/except.
+    def _report_failure(exc_type, exc, tb):
+        print(f"\n[Error] demo aborted: {exc}")
+        traceback.print_exception(exc_type, exc, tb)
+
+    sys.excepthook = _report_failure
+
+    example1_basic_source_info()
+    example2_function_name()
+    example3_full_path()
+    example4_module_info()
+    example5_compact_format()
+    example6_with_rich()
+    example7_file_output_with_source()
+    example8_advanced_logger_with_source()
+    example9_custom_source_formatter()
+    example10_production_format()
+
+    print(f"\n{BAR70}\n✅ All examples completed!\n{BAR70}")
     print("\n📝 Common format variables:")
     print("  - %(filename)s    : File name")
     print("  - %(pathname)s    : Full path")
@@ -403,4 +358,4 @@ if __name__ == "__main__":
     print("\n💡 Recommended formats:")
     print("  Development: [%(levelname).1s] %(filename)s:%(lineno)d:%(funcName)s() | %(message)s")
     print("  Production: %(asctime)s | %(levelname)-8s | [%(filename)s:%(lineno)d] | %(message)s")
-    print("=" * 70)
+    print(BAR70)
@@ -17,21 +17,16 @@
 import logging
 import sys
 
-if sys.platform == "win32":
-    import codecs
-
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+from _common import BAR80, DASH80, ensure_utf8
 
 from advlog.core.formatter import AlignedFormatter, CompactFormatter, TableFormatter
 
-print("=" * 80)
-print("Alignment format example")
-print("=" * 80)
+ensure_utf8()
+
+print(f"{BAR80}\nAlignment format example\n{BAR80}")
 
 # ========== Example 1: Standard alignment (most commonly used) ==========
-print("\n[Example 1] Standard alignment - recommended for daily use")
-print("-" * 80)
+print(f"\n[Example 1] Standard alignment - recommended for daily use\n{DASH80}")
 
 formatter1 = AlignedFormatter(
     time_width=12,  # Time field width
@@ -53,8 +48,7 @@ logger1.debug("Debug information: variable x=42")
 
 
 # ========== Example 2: Table format ==========
-print("\n[Example 2] Table format - suitable for log review")
-print("-" * 80)
+print(f"\n[Example 2] Table format - suitable for log review\n{DASH80}")
 
 formatter2 = TableFormatter()
 
@@ -67,17 +61,17 @@ logger2.addHandler(handler2)
 
 
 def process_request():
-    logger2.info("Received HTTP request")
-    logger2.debug("Validating token")
-    logger2.info("Returning response: 200 OK")
+    info, debug = logger2.info, logger2.debug
+    info("Received HTTP request")
+    debug("Validating token")
+    info("Returning response: 200 OK")
 
 
 process_request()
 
 
 # ========== Example 3: Compact format ==========
-print("\n[Example 3] Compact format - recommended for development environment")
-print("-" * 80)
+print(f"\n[Example 3] Compact format - recommended for development environment\n{DASH80}")
 
 formatter3 = CompactFormatter(location_width=30)
 
@@ -95,8 +89,7 @@ logger3.error("Processing failed")
 
 
 # ========== Comparison: Left alignment vs Right alignment ==========
-print("\n[Comparison] Left alignment vs Right alignment")
-print("-" * 80)
+print(f"\n[Comparison] Left alignment vs Right alignment\n{DASH80}")
 
 print("\nLeft alignment (default):")
 formatter_left = AlignedFormatter(
@@ -140,9 +133,7 @@ logger_right.warning("All fields right aligned")
 
 
 # ========== Summary ==========
-print("\n" + "=" * 80)
-print("Summary")
-print("=" * 80)
+print(f"\n{BAR80}\nSummary\n{BAR80}")
 print()
 print("Alignment functionality is complete, supporting:")
 print("  ✓ Custom field widths")
@@ -155,4 +146,4 @@ print("  from core import AlignedFormatter, TableFormatter, CompactFormatter")
 print("  formatter = AlignedFormatter(time_width=12, level_width=8, location_width=35)")
 print()
 print("View complete examples: python demo_aligned_logging.py")
-print("=" * 80)
+print(BAR80)
@@ -14,25 +14,23 @@
 
 """Advanced examples demonstrating logger coordination and smart naming."""
 
-import sys
-import time
-
-# Set UTF-8 encoding for Windows
-if sys.platform == "win32":
-    import codecs
-
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+from _common import ensure_utf8, pace
 
 from advlog.core import LoggerManager, create_logger_group
 from advlog.utils import LogNamingStrategy
 
+# Reconfigures the existing streams in place on Windows consoles; no
+# codecs.StreamWriter proxy in front of every print
+ensure_utf8()
+
+# Separator rule built once; each banner is a single pre-formatted write
+# instead of three separate prints
+_BANNER70 = "\n" + "=" * 70 + "\n{title}\n" + "=" * 70
+
 
 def example_shared_console_separate_files():
     """Example 1: Multiple modules, shared console, separate files."""
-    print("\n" + "=" * 70)
-    print("Example 1: Shared Console + Separate Files")
-    print("=" * 70)
+    print(_BANNER70.format(title="Example 1: Shared Console + Separate Files"))
 
     # Create manager with shared console
     manager = LoggerManager(shared_console=True, use_color=True)
@@ -59,9 +57,7 @@ def example_shared_console_separate_files():
 
 def example_merged_logging():
     """Example 2: Multiple modules, merged into single file."""
-    print("\n" + "=" * 70)
-    print("Example 2: Shared Console + Merged File")
-    print("=" * 70)
+    print(_BANNER70.format(title="Example 2: Shared Console + Merged File"))
 
     # Create manager with shared console and shared file
     manager = LoggerManager(shared_console=True, shared_file="logs/advanced/all_merged.log", use_color=True)
@@ -85,9 +81,7 @@ def example_merged_logging():
 
 def example_flexible_strategy():
     """Example 3: Mix of separate, merged, and console-only."""
-    print("\n" + "=" * 70)
-    print("Example 3: Flexible Logging Strategies")
-    print("=" * 70)
+    print(_BANNER70.format(title="Example 3: Flexible Logging Strategies"))
 
     manager = LoggerManager(shared_console=True, shared_file="logs/advanced/important.log", use_color=True)
 
@@ -115,9 +109,7 @@ def example_flexible_strategy():
 
 def example_smart_naming():
     """Example 4: Smart log file naming strategies."""
-    print("\n" + "=" * 70)
-    print("Example 4: Smart Log File Naming")
-    print("=" * 70)
+    print(_BANNER70.format(title="Example 4: Smart Log File Naming"))
 
     # Timestamped naming
     log1 = LogNamingStrategy.timestamped("myapp", suffix="training")
@@ -155,9 +147,7 @@ def example_smart_naming():
 
 def example_convenience_function():
     """Example 5: Quick logger group creation."""
-    print("\n" + "=" * 70)
-    print("Example 5: Quick Logger Group Creation")
-    print("=" * 70)
+    print(_BANNER70.format(title="Example 5: Quick Logger Group Creation"))
 
     # Create multiple coordinated loggers at once
     loggers = create_logger_group(
@@ -181,9 +171,7 @@ def example_convenience_function():
 
 def example_real_world_webapp():
     """Example 6: Real-world web application logging."""
-    print("\n" + "=" * 70)
-    print("Example 6: Real-World Web Application")
-    print("=" * 70)
+    print(_BANNER70.format(title="Example 6: Real-World Web Application"))
 
     # Setup for a typical web application
     timestamp = LogNamingStrategy.timestamped("webapp", suffix="")
@@ -200,14 +188,16 @@ def example_real_world_webapp():
     app_log = manager.register_logger("App", file_strategy="merged")
     db_log = manager.register_logger("DB", file_strategy="merged")
 
-    # Simulate web application activity
-    access_log.info("192.168.1.100 - GET /api/users - 200")
-    app_log.info("Processing user list request")
-    db_log.info("SELECT * FROM users LIMIT 50")
-    access_log.info("192.168.1.101 - POST /api/login - 200")
+    # Simulate web application activity; repeated-call loggers get their
+    # bound info methods resolved once up front
+    access_info, app_info, db_info = access_log.info, app_log.info, db_log.info
+    access_info("192.168.1.100 - GET /api/users - 200")
+    app_info("Processing user list request")
+    db_info("SELECT * FROM users LIMIT 50")
+    access_info("192.168.1.101 - POST /api/login - 200")
 
     # Error scenario
-    access_log.info("192.168.1.102 - GET /api/broken - 500")
+    access_info("192.168.1.102 - GET /api/broken - 500")
     error_log.error("Exception in /api/broken: NullPointerException")
     app_log.error("Failed to process request", exc_info=False)
 
@@ -219,9 +209,7 @@ def example_real_world_webapp():
 
 def example_training_with_manager():
     """Example 7: ML training with coordinated logging."""
-    print("\n" + "=" * 70)
-    print("Example 7: ML Training with Logger Manager")
-    print("=" * 70)
+    print(_BANNER70.format(title="Example 7: ML Training with Logger Manager"))
 
     # Create timestamped training session
     session_name = LogNamingStrategy.timestamped("training", suffix="resnet")
@@ -243,11 +231,16 @@ def example_training_with_manager():
     train_logger.info("Starting training: ResNet-50 on ImageNet")
     system_logger.info("GPU Memory: 10.2 GB / 24 GB")
 
+    # %-style args defer formatting to the handlers (and skip it entirely
+    # for filtered records) instead of building a fresh f-string per call.
+    # Binding logger.info to locals outside the loop also skips an attribute
+    # lookup per call - worth copying for real per-batch logging.
+    tinfo, minfo, sinfo = train_logger.info, metrics_logger.info, system_logger.info
     for epoch in range(1, 4):
-        train_logger.info(f"Epoch {epoch}/10 started")
-        metrics_logger.info(f"Epoch {epoch}: loss=0.{50 - epoch * 10:.2f}, acc=0.{70 + epoch * 5:.2f}")
-        system_logger.info(f"GPU utilization: {85 + epoch}%")
-        time.sleep(0.1)
+        tinfo("Epoch %d/10 started", epoch)
+        minfo("Epoch %d: loss=0.%.2f, acc=0.%.2f", epoch, 50 - epoch * 10, 70 + epoch * 5)
+        sinfo("GPU utilization: %d%%", 85 + epoch)
+        pace(0.1)
 
     train_logger.info("Training completed successfully")
 
@@ -277,10 +270,9 @@ def run_all_examples():
 
             traceback.print_exc()
 
-    print("\n" + "=" * 70)
-    print("All advanced examples completed!")
-    print("Check the 'logs/advanced/' directory for log files.")
-    print("=" * 70)
+    print(
+        f"\n{'=' * 70}\nAll advanced examples completed!\nCheck the 'logs/advanced/' directory for log files.\n{'=' * 70}"
+    )
 
 
 if __name__ == "__main__":
@@ -17,19 +17,18 @@
 Demonstrates various scenarios of progress bars with logging.
 """
 
-import sys
+import multiprocessing
 import time
 
-# Set UTF-8 encoding for Windows
-if sys.platform == "win32":
-    import codecs
-
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+from _common import LineBuffer, Pacer, ThrottledProgress, ensure_utf8
 
 from advlog.core import AdvancedLogger, LoggerConfig
 from advlog.plugins import ProgressTracker, create_progress_bar
 
+# Reconfigures the existing streams in place on Windows consoles; no
+# codecs.StreamWriter proxy in front of every print
+ensure_utf8()
+
 
 def example1_basic_progress_with_logging():
     """Example 1: Progress bar at bottom, logs scrolling above"""
@@ -54,17 +53,32 @@ def example1_basic_progress_with_logging():
         task1 = progress.add_task("[cyan]Downloading files...", total=50)
         task2 = progress.add_task("[green]Processing data...", total=100)
 
-        for i in range(100):
+        # Advances are accumulated locally and only rendered when the bar
+        # visibly moves, instead of once per iteration
+        throttled1 = ThrottledProgress(progress, task1, total=50)
+        throttled2 = ThrottledProgress(progress, task2, total=100)
+
+        # Pace per chunk instead of per item: one sleep and one advance per
+        # chunk cuts wakeups and redraws by CHUNK x, and the bar still moves
+        # far more often than the eye can track
+        CHUNK = 10
+        pacer = Pacer(per_iter=0.5)
+        for c in range(10):
             # Update progress
-            if i < 50:
-                progress.update(task1, advance=1)
-            progress.update(task2, advance=1)
+            if c < 5:
+                throttled1.tick(CHUNK)
+            throttled2.tick(CHUNK)
+
+            # Output lines simultaneously (shown above progress bar);
+            # console.print skips the timestamp/caller render that
+            # console.log pays on every call
+            if c % 2 == 0:
+                progress.console.print(f"[blue]Processed {c * CHUNK} items")
 
-            # Output logs simultaneously (shown above progress bar)
-            if i % 20 == 0:
-                progress.console.log(f"[blue]Processed {i} items")
+            pacer.wait()
 
-            time.sleep(0.05)
+        throttled1.flush()
+        throttled2.flush()
 
     print("\n✓ Progress bar auto-disappears after completion, logs preserved")
     print("✓ Progress bar stays at bottom, logs scroll above")
@@ -85,21 +99,26 @@ def example2_persistent_progress():
         task1 = progress.add_task("[cyan]Task 1", total=30)
         task2 = progress.add_task("[green]Task 2", total=50)
 
-        # Complete task 1
-        for i in range(30):
-            progress.update(task1, advance=1)
-            if i % 10 == 0:
-                progress.console.log(f"[blue]Task 1 progress: {i}/30")
-            time.sleep(0.03)
+        # Complete task 1 (chunked advance: one sleep and render per chunk)
+        throttled1 = ThrottledProgress(progress, task1, total=30)
+        pacer = Pacer(per_iter=0.3)
+        for c in range(3):
+            throttled1.tick(10)
+            progress.console.print(f"[blue]Task 1 progress: {c * 10}/30")
+            pacer.wait()
+        throttled1.flush()
 
         progress.console.log("[green]✓ Task 1 completed")
 
         # Complete task 2
-        for i in range(50):
-            progress.update(task2, advance=1)
-            if i % 15 == 0:
-                progress.console.log(f"[blue]Task 2 progress: {i}/50")
-            time.sleep(0.02)
+        throttled2 = ThrottledProgress(progress, task2, total=50)
+        pacer = Pacer(per_iter=0.2)
+        for c in range(5):
+            throttled2.tick(10)
+            if c % 2 == 0:
+                progress.console.print(f"[blue]Task 2 progress: {c * 10}/50")
+            pacer.wait()
+        throttled2.flush()
 
         progress.console.log("[green]✓ Task 2 completed")
 
@@ -126,14 +145,17 @@ def example3_auto_remove_completed():
         for task_id, task_name in tasks:
             progress.console.log(f"[yellow]Starting {task_name}")
 
-            for i in range(20):
-                progress.update(task_id, advance=1)
-                time.sleep(0.05)
+            throttled = ThrottledProgress(progress, task_id, total=20)
+            pacer = Pacer(per_iter=0.5)
+            for c in range(2):
+                throttled.tick(10)
+                pacer.wait()
+            throttled.flush()
 
             progress.console.log(f"[green]✓ {task_name} completed")
 
-            # Manually remove completed task
-            progress.remove_task(task_id)
+            # Hide the completed task (cheaper than a full re-layout)
+            progress.finish_task(task_id)
             progress.console.log(f"[dim]Removed progress bar for {task_name}")
 
             time.sleep(0.5)
@@ -160,24 +182,45 @@ def example4_mixed_strategies():
             task = progress.add_task(f"[cyan]Subtask {i} (temporary)", total=30)
             temp_tasks.append(task)
 
-        # Execution flow
-        for i in range(100):
-            # Update main task
-            progress.update(important_task, advance=1)
+        # Execution flow; intra-iteration fragments are buffered and
+        # emitted as one console.log per boundary
+        throttled_main = ThrottledProgress(progress, important_task, total=100)
+        throttled_temp = [ThrottledProgress(progress, task, total=30) for task in temp_tasks]
+        buf = LineBuffer()
 
-            # Update and complete subtasks
-            for idx, temp_task in enumerate(temp_tasks):
-                if i < 30:
-                    progress.update(temp_task, advance=1)
-                elif i == 30 + idx * 5:
-                    # Remove temporary task after completion
-                    progress.remove_task(temp_task)
-                    progress.console.log(f"[dim]✓ Subtask {idx + 1} completed and removed")
+        # Phase A: subtasks run alongside the main task; straight-line
+        # updates with no per-iteration branch tests. One pacer covers
+        # both work phases so the overall cadence holds at 100 x 30ms.
+        pacer = Pacer(per_iter=0.03)
+        for i in range(30):
+            throttled_main.tick()
+            for throttled in throttled_temp:
+                throttled.tick()
 
             if i % 25 == 0:
-                progress.console.log(f"[blue]Main task progress: {i}%")
+                buf.append(f"[blue]Main task progress: {i}%")
+                buf.flush(progress.console)
+
+            pacer.wait()
 
-            time.sleep(0.03)
+        # Phase B: all subtasks are complete; remove each one in order
+        for idx, temp_task in enumerate(temp_tasks):
+            throttled_temp[idx].flush()
+            progress.finish_task(temp_task)
+            buf.append(f"[dim]✓ Subtask {idx + 1} completed and removed[/dim]")
+        buf.flush(progress.console)
+
+        # Phase C: remaining main-task iterations
+        for i in range(30, 100):
+            throttled_main.tick()
+
+            if i % 25 == 0:
+                buf.append(f"[blue]Main task progress: {i}%")
+                buf.flush(progress.console)
+
+            pacer.wait()
+
+        throttled_main.flush()
 
     print("\n✓ Main task remains displayed")
     print("✓ Subtasks auto-removed after completion")
@@ -189,19 +232,18 @@ def example5_logger_integration():
     print("Example 5: Progress Bar + LoggerManager Integration")
     print("=" * 70)
 
-    from core import LoggerManager
+    from advlog.core import LoggerManager
 
-    # Note: Don't use shared_console to avoid conflicts with Progress
-    manager = LoggerManager(shared_console=False)
+    # The manager's shared console handler writes to the same console the
+    # progress bar renders on, so a single logger.info call reaches both
+    # the console (above the bar, conflict-free) and the module's file -
+    # no paired progress.console.log, one format pass per event
+    manager = LoggerManager(shared_console=True)
 
     # Create loggers for different modules, output to files
-    api_logger = manager.register_logger(
-        "API", file_strategy="separate", log_file="logs/progress_api.log", use_console=False
-    )
+    api_logger = manager.register_logger("API", file_strategy="separate", log_file="logs/progress_api.log")
 
-    db_logger = manager.register_logger(
-        "Database", file_strategy="separate", log_file="logs/progress_db.log", use_console=False
-    )
+    db_logger = manager.register_logger("Database", file_strategy="separate", log_file="logs/progress_db.log")
 
     # Create progress bar
     progress = create_progress_bar(transient=False)
@@ -210,22 +252,25 @@ def example5_logger_integration():
         task1 = progress.add_task("[cyan]API Request Processing", total=50)
         task2 = progress.add_task("[green]Database Operations", total=30)
 
+        throttled1 = ThrottledProgress(progress, task1, total=50)
+        throttled2 = ThrottledProgress(progress, task2, total=30)
+
+        pacer = Pacer(per_iter=0.05)
         for i in range(50):
-            progress.update(task1, advance=1)
+            throttled1.tick()
 
-            # Use progress.console.log to output to console (no conflict)
             if i % 10 == 0:
-                progress.console.log(f"[blue]API: Processing request {i}/50")
-                # Also write to log file
-                api_logger.info(f"Processing request {i}/50")
+                api_logger.info("Processing request %d/50", i)
 
             if i < 30:
-                progress.update(task2, advance=1)
+                throttled2.tick()
                 if i % 10 == 0:
-                    progress.console.log(f"[green]DB: Executing query {i}/30")
-                    db_logger.info(f"Executing query {i}/30")
+                    db_logger.info("Executing query %d/30", i)
+
+            pacer.wait()
 
-            time.sleep(0.05)
+        throttled1.flush()
+        throttled2.flush()
 
         progress.console.log("[green]✓ All tasks completed")
 
@@ -254,16 +299,19 @@ def example6_dynamic_task_management():
             active_tasks[round] = task_id
 
             # Process task
-            for i in range(20):
-                progress.update(task_id, advance=1)
-                time.sleep(0.05)
+            throttled = ThrottledProgress(progress, task_id, total=20)
+            pacer = Pacer(per_iter=0.5)
+            for c in range(2):
+                throttled.tick(10)
+                pacer.wait()
+            throttled.flush()
 
             progress.console.log(f"[green]✓ Round {round} completed")
 
             # Decide whether to remove based on strategy
             if round < 3:
-                # Remove completed old task
-                progress.remove_task(task_id)
+                # Hide completed old task
+                progress.finish_task(task_id)
                 progress.console.log(f"[dim]  Removed round {round} progress bar")
             else:
                 # Keep the last task
@@ -296,20 +344,18 @@ def example7_nested_progress():
             # Stage task (temporary)
             stage_task = progress.add_task(f"[cyan]{stage_name}", total=30)
 
-            for i in range(30):
-                # Update stage progress
-                progress.update(stage_task, advance=1)
+            pacer = Pacer(per_iter=0.3)
+            for c in range(3):
+                # The lockstep stage/overall pair advances under a single
+                # lock acquisition per chunk
+                progress.update_many([(stage_task, 10), (total_task, 10)])
 
-                # Update overall progress
-                progress.update(total_task, advance=1)
-
-                if i % 10 == 0:
-                    progress.console.log(f"  [dim]{stage_name}: {i}/30")
+                progress.console.print(f"  [dim]{stage_name}: {c * 10}/30")
 
-                time.sleep(0.03)
+                pacer.wait()
 
-            # Remove stage task
-            progress.remove_task(stage_task)
+            # Hide stage task
+            progress.finish_task(stage_task)
             progress.console.log(f"[green]✓ {stage_name} completed")
             time.sleep(0.3)
 
@@ -333,7 +379,14 @@ def run_all_examples():
 
     for example in examples:
         try:
-            example()
+            # Each example runs in its own process, so loggers, handlers
+            # and Rich state are discarded between examples instead of
+            # accumulating on the module-level singletons (later examples
+            # would otherwise dispatch through ever-longer handler lists).
+            # A crash in one example also can't take down the rest.
+            proc = multiprocessing.Process(target=example)
+            proc.start()
+            proc.join()
             time.sleep(1)  # Pause between examples
         except Exception as e:
             print(f"\n[Error] {example.__name__}: {e}")
@@ -14,16 +14,15 @@
 
 """Minimal demo - Quick overview of core features in 3 minutes"""
 
-import sys
 import time
 
-from advlog.plugins import ProgressTracker, create_progress_bar
+from _common import Pacer, ThrottledProgress, ensure_utf8
 
-if sys.platform == "win32":
-    import codecs
+from advlog.plugins import ProgressTracker, create_progress_bar
 
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+# Reconfigures the existing streams in place on Windows consoles; no
+# codecs.StreamWriter proxy in front of every print
+ensure_utf8()
 
 print("\n" + "=" * 70)
 print("Core Features Demo - Quick Overview")
@@ -38,14 +37,18 @@ time.sleep(1)
 with ProgressTracker() as progress:
     task = progress.add_task("[cyan]Downloading files", total=20)
 
-    for i in range(20):
-        progress.update(task, advance=1)
+    # Advances accumulate locally and the loop paces per 5-file chunk:
+    # one sleep and one render per chunk instead of per file
+    throttled = ThrottledProgress(progress, task, total=20)
+    pacer = Pacer(per_iter=0.5)
+    for c in range(4):
+        throttled.tick(5)
 
-        if i % 5 == 0:
-            # Note: logs are displayed above the progress bar!
-            progress.console.log(f"[blue]✓ Downloaded {i} files")
+        # Note: logs are displayed above the progress bar!
+        progress.console.print(f"[blue]✓ Downloaded {c * 5} files")
 
-        time.sleep(0.1)
+        pacer.wait()
+    throttled.flush()
 
 print("✓ Progress bar stays at bottom, logs above")
 time.sleep(1)
@@ -60,12 +63,15 @@ with create_progress_bar(auto_remove_completed=True) as progress:
     for i in range(1, 4):
         task = progress.add_task(f"[cyan]Task {i}", total=8)
 
-        for j in range(8):
-            progress.update(task, advance=1)
-            time.sleep(0.08)
+        throttled = ThrottledProgress(progress, task, total=8)
+        pacer = Pacer(per_iter=0.32)
+        for c in range(2):
+            throttled.tick(4)
+            pacer.wait()
+        throttled.flush()
 
         # Auto-removed after completion!
-        progress.log(f"[green]✓ Task {i} completed [dim](auto-removed)")
+        progress.console.print(f"[green]✓ Task {i} completed [dim](auto-removed)")
         time.sleep(0.3)
 
 print("✓ Completed tasks auto-disappear, clean interface")
@@ -84,18 +90,19 @@ with create_progress_bar(auto_remove_completed=True) as progress:
         persistent=True,  # Keep displayed
     )
 
-    # 3 subtasks
+    # 3 subtasks; the lockstep sub/main pair advances under one lock
+    # acquisition per chunk instead of two
     for i in range(1, 4):
         sub = progress.add_task(f"[cyan]Stage {i}", total=10)
 
-        for j in range(10):
-            progress.update(sub, advance=1)
-            progress.update(main, advance=1)
-            time.sleep(0.05)
+        pacer = Pacer(per_iter=0.25)
+        for c in range(2):
+            progress.update_many([(sub, 5), (main, 5)])
+            pacer.wait()
 
-        progress.log(f"[green]✓ Stage {i} completed [dim](auto-removed)")
+        progress.console.print(f"[green]✓ Stage {i} completed [dim](auto-removed)")
 
-    progress.log("[green bold]✓ All stages completed! Main task kept")
+    progress.console.print("[green bold]✓ All stages completed! Main task kept")
 
 print("✓ Main task kept, subtasks auto-removed")
 time.sleep(1)
@@ -17,6 +17,7 @@
 Demonstrates using advlog's get_logger and get_progress in a separate module.
 The logger is automatically shared with the main module via the global singleton.
 """
+import logging
 import time
 
 from advlog import get_logger
@@ -24,6 +25,8 @@ from advlog import get_logger
 # Get logger for this module - uses the same LoggerManager as main.py
 log = get_logger(__name__)
 
+_DEBUG = logging.DEBUG
+
 
 def load_data(progress):
     """Load data from multiple sources.
@@ -49,16 +52,19 @@ def load_data(progress):
 
     data = {}
     for i, filename in enumerate(files):
-        log.debug(f"Loading file: {filename}")
         time.sleep(0.2)  # Simulate file loading
 
         # Simulate loaded data
         data[filename] = {"rows": 100 * (i + 1), "columns": 10}
 
-        log.debug(f"Loaded {data[filename]['rows']} rows from {filename}")
+        # One lazily-formatted record per file instead of a before/after
+        # pair; the level guard skips even argument lookup (and the queue
+        # put, under async logging) when DEBUG is filtered out
+        if log.isEnabledFor(_DEBUG):
+            log.debug("Processed %s (%d rows)", filename, data[filename]["rows"])
         progress.update(task, advance=1)
 
-    progress.remove_task(task)
-    log.info(f"Data loading complete: {len(files)} files loaded")
+    progress.finish_task(task)
+    log.info("Data loading complete: %d files loaded", len(files))
 
     return data
@@ -39,45 +39,46 @@ def validate_data(data):
     """
     log.info("Starting data validation")
 
-    task = get_progress().add_task("Validating data", total=3)
+    # Singleton lookup once per call; prog.X is a LOAD_FAST instead of a
+    # LOAD_GLOBAL plus call on every progress touch
+    # The logical validation is one atomic step, so the task has total=1
+    prog = get_progress()
+    task = prog.add_task("Validating data", total=1)
 
     try:
-        # Check if data exists
-        log.debug("Checking if data exists...")
-        time.sleep(0.2)
         if not data:
             raise ValueError("Data is empty")
-        get_progress().update(task, advance=1)
-
-        # Check required fields
-        log.debug("Checking required fields...")
-        time.sleep(0.2)
-        required_fields = ["users.csv", "products.csv"]
-        missing = [field for field in required_fields if field not in data]
-        if missing:
-            raise ValueError(f"Missing required files: {', '.join(missing)}")
-        get_progress().update(task, advance=1)
 
-        # Check data integrity
-        log.debug("Checking data integrity...")
-        time.sleep(0.2)
+        # Fused pass: structure, row counts, and required-file membership
+        # are all verified in a single walk over the dict instead of three
+        # sequential stages
+        required = {"users.csv", "products.csv"}
+        seen = set()
         for filename, file_data in data.items():
             if not isinstance(file_data, dict) or "rows" not in file_data:
                 raise ValueError(f"Invalid data structure in {filename}")
             if file_data["rows"] <= 0:
                 raise ValueError(f"Invalid row count in {filename}: {file_data['rows']}")
+            seen.add(filename)
+
+        missing = required - seen
+        if missing:
+            raise ValueError(f"Missing required files: {', '.join(sorted(missing))}")
 
-        get_progress().update(task, advance=1)
-        get_progress().remove_task(task)
+        prog.update(task, advance=1)
 
         log.info("Data validation successful")
         return True
 
     except ValueError as e:
-        get_progress().remove_task(task)
-        log.error(f"Validation failed: {e}")
+        log.error("Validation failed: %s", e)
         raise
 
+    finally:
+        # Single cleanup path for both the success and error branches;
+        # hiding the row avoids a live re-layout
+        prog.finish_task(task)
+
 
 def process_with_error_handling(data):
     """Process data with comprehensive error handling.
@@ -99,16 +100,22 @@ def process_with_error_handling(data):
         log.debug("Simulating data processing...")
         time.sleep(0.3)
 
-        # Simulate a potential error condition
-        total_rows = sum(file_data["rows"] for file_data in data.values())
+        # Single pass over the data: the row total and the large-file scan
+        # are fused instead of iterating the dict twice
+        total_rows = 0
+        big_files = []
+        for filename, file_data in data.items():
+            rows = file_data["rows"]
+            total_rows += rows
+            if rows > 400:
+                big_files.append(filename)
+
         if total_rows > 1000:
-            log.warning(f"Large dataset detected: {total_rows} rows")
+            log.warning("Large dataset detected: %d rows", total_rows)
 
-        # Simulate processing errors
-        for filename, file_data in data.items():
-            if file_data["rows"] > 400:
-                log.warning(f"Large file may cause performance issues: {filename}")
-                # In a real scenario, you might handle this differently
+        for filename in big_files:
+            log.warning("Large file may cause performance issues: %s", filename)
+            # In a real scenario, you might handle this differently
 
         log.info("Processing completed successfully")
         return {
@@ -119,14 +126,14 @@ def process_with_error_handling(data):
         }
 
     except ValueError as e:
-        log.error(f"Processing failed due to validation error: {e}", exc_info=True)
+        log.error("Processing failed due to validation error: %s", e, exc_info=True)
         return {
             "status": "error",
             "error_type": "ValidationError",
             "error_message": str(e),
         }
     except Exception as e:
-        log.critical(f"Unexpected error during processing: {e}", exc_info=True)
+        log.critical("Unexpected error during processing: %s", e, exc_info=True)
         return {
             "status": "error",
             "error_type": "UnexpectedError",
@@ -143,9 +150,10 @@ def recover_from_error(error_info):
     Returns:
         bool: True if recovery successful
     """
-    log.info(f"Attempting to recover from error: {error_info.get('error_type')}")
+    log.info("Attempting to recover from error: %s", error_info.get("error_type"))
 
-    task = get_progress().add_task("Recovering from error", total=3)
+    prog = get_progress()
+    task = prog.add_task("Recovering from error", total=3)
 
     try:
         # Analyze error
@@ -156,28 +164,29 @@ def recover_from_error(error_info):
         if error_type == "ValidationError":
             log.info("Attempting to fix validation issues...")
             time.sleep(0.2)
-            get_progress().update(task, advance=1)
+            prog.update(task, advance=1)
 
             # Attempt to recover
             log.info("Applying recovery strategy...")
             time.sleep(0.2)
-            get_progress().update(task, advance=1)
+            prog.update(task, advance=1)
 
             # Validate recovery
             log.debug("Verifying recovery...")
             time.sleep(0.2)
-            get_progress().update(task, advance=1)
+            prog.update(task, advance=1)
 
             log.info("Recovery successful")
-            get_progress().remove_task(task)
             return True
 
         else:
-            log.error(f"Cannot recover from error type: {error_type}")
-            get_progress().remove_task(task)
+            log.error("Cannot recover from error type: %s", error_type)
             return False
 
     except Exception as e:
-        log.error(f"Recovery attempt failed: {e}", exc_info=True)
-        get_progress().remove_task(task)
+        log.error("Recovery attempt failed: %s", e, exc_info=True)
         return False
+
+    finally:
+        # Single cleanup path for all branches
+        prog.finish_task(task)
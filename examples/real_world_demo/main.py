@@ -30,6 +30,12 @@ from pathlib import Path
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+# Preloaded before any progress bar is live, so import-time work (logger
+# registration, file creation) never contends with the Rich render loop.
+# initialize() below re-attaches these modules' loggers to the configured
+# handlers.
+from examples.real_world_demo import data_loader, error_handler, processor, reporter
+
 from advlog import get_logger, get_progress, initialize
 
 
@@ -66,6 +72,9 @@ def main():
         show_location=True,
         log_file="D:/Workspace/m_wang/codelib/advlog/logs/breakpoint_test.log",
         file_mode="a",
+        # File writes and console rendering happen on a listener thread;
+        # the workflow thread only enqueues records
+        async_logging=True,
     )
 
     log = get_logger(__name__)
@@ -73,9 +82,6 @@ def main():
     log.info("Starting real-world demo workflow")
     log.info("=" * 60)
 
-    # Import modules after initialization to ensure they get the same logger
-    from examples.real_world_demo import data_loader, error_handler, processor, reporter
-
     # Get global progress tracker
     progress = get_progress()
 
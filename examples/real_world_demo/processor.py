@@ -17,6 +17,7 @@
 Demonstrates using advlog's get_logger in a processing module.
 Shows how to log at different levels and track progress for long-running tasks.
 """
+import logging
 import time
 
 from advlog import get_logger
@@ -24,6 +25,8 @@ from advlog import get_logger
 # Get logger for this module
 log = get_logger(__name__)
 
+_DEBUG = logging.DEBUG
+
 
 def process(data, progress):
     """Process loaded data.
@@ -37,9 +40,8 @@ def process(data, progress):
     """
     log.info("Starting data processing")
 
-    total_rows = sum(file_data["rows"] for file_data in data.values())
-    log.debug(f"Total rows to process: {total_rows}")
-
+    # Row totals accumulate inside the main loop below; no separate
+    # pre-pass over the dict just to sum them
     task = progress.add_task("Processing data", total=100)
 
     results = {
@@ -48,26 +50,34 @@ def process(data, progress):
         "errors": 0,
     }
 
-    for i, (filename, file_data) in enumerate(data.items()):
-        log.debug(f"Processing: {filename}")
+    # One division for the whole run instead of one per step
+    advance_per_step = 100.0 / (len(data) * 5)
 
-        # Simulate processing
+    for i, (filename, file_data) in enumerate(data.items()):
+        # Simulate processing; the advance is accumulated locally and
+        # pushed once per file instead of once per step
+        advance = 0.0
         for step in range(5):
             time.sleep(0.1)
-            progress.update(task, advance=100 / (len(data) * 5))
+            advance += advance_per_step
+        progress.update(task, advance=advance)
 
         results["processed_files"] += 1
         results["total_rows"] += file_data["rows"]
 
-        # Simulate occasional warning
+        # One record per file instead of a debug/warning pair; the large
+        # file case still surfaces at WARNING level
         if file_data["rows"] > 300:
-            log.warning(f"Large file detected: {filename} ({file_data['rows']} rows)")
+            log.warning("Processed %s - large file detected (%d rows)", filename, file_data["rows"])
+        elif log.isEnabledFor(_DEBUG):
+            log.debug("Processed %s", filename)
 
-    progress.remove_task(task)
+    # finish_task lands the bar exactly on its total (no float drift) and
+    # hides the row without forcing a re-layout
+    progress.finish_task(task)
 
     log.info(
-        f"Processing complete: {results['processed_files']} files, "
-        f"{results['total_rows']} rows processed"
+        "Processing complete: %d files, %d rows processed", results["processed_files"], results["total_rows"]
     )
 
     return results
@@ -17,6 +17,7 @@
 Demonstrates using advlog's get_logger for generating output reports.
 Shows structured logging with indentation and metrics.
 """
+import logging
 import time
 
 from advlog import get_logger
@@ -24,40 +25,80 @@ from advlog import get_logger
 # Get logger for this module
 log = get_logger(__name__)
 
+# Cached level constant: the isEnabledFor guards below run on every call,
+# so skip the module attribute lookup each time
+_DEBUG = logging.DEBUG
 
-def generate_report(results, progress):
+
+class _LazyFormat:
+    """Defer message formatting until a handler actually emits the record.
+
+    Passed as a ``%s`` argument, the wrapped callable only runs when the
+    formatter calls ``str()`` on it - after the level check - so records
+    filtered out by the effective level never pay the dict lookups and
+    string formatting behind the message.
+    """
+
+    __slots__ = ("_fn",)
+
+    def __init__(self, fn):
+        self._fn = fn
+
+    def __str__(self):
+        return self._fn()
+
+
+def generate_report(results, progress, *, demo_pacing=False):
     """Generate a summary report.
 
     Args:
         results: Processing results from processor
         progress: ProgressTracker instance
+        demo_pacing: Sleep between steps to simulate work. Off by default
+            so real invocations don't pay 0.9s of hardcoded idle time.
     """
     log.info("Starting report generation")
 
     task = progress.add_task("Generating report", total=3)
 
     # Step 1: Summary statistics
-    log.debug("Generating summary statistics...")
-    time.sleep(0.3)
-    progress.update(task, advance=1)
-
-    log.info("=== Report Summary ===")
-    log.info(f"  Files processed: {results['processed_files']}")
-    log.info(f"  Total rows: {results['total_rows']}")
-    log.info(f"  Errors: {results['errors']}")
+    if log.isEnabledFor(_DEBUG):
+        log.debug("Generating summary statistics...")
+    if demo_pacing:
+        time.sleep(0.3)
 
     # Step 2: Performance metrics
-    log.debug("Calculating performance metrics...")
-    time.sleep(0.3)
-    progress.update(task, advance=1)
+    if log.isEnabledFor(_DEBUG):
+        log.debug("Calculating performance metrics...")
+    if demo_pacing:
+        time.sleep(0.3)
+
+    # The whole summary block goes out as one record: one trip through
+    # Logger.handle, one Formatter.format and one handler write instead
+    # of five. Building the block (and the average-rows arithmetic that
+    # only feeds it) stays lazy behind the _LazyFormat wrapper.
+    def _summary(r=results):
+        avg_rows = r["total_rows"] / max(r["processed_files"], 1)
+        return "\n".join(
+            (
+                "=== Report Summary ===",
+                f"  Files processed: {r['processed_files']}",
+                f"  Total rows: {r['total_rows']}",
+                f"  Errors: {r['errors']}",
+                f"  Average rows per file: {avg_rows:.1f}",
+            )
+        )
 
-    avg_rows = results["total_rows"] / max(results["processed_files"], 1)
-    log.info(f"  Average rows per file: {avg_rows:.1f}")
+    log.info("%s", _LazyFormat(_summary))
 
     # Step 3: Finalize
-    log.debug("Finalizing report...")
-    time.sleep(0.3)
-    progress.update(task, advance=1)
+    if log.isEnabledFor(_DEBUG):
+        log.debug("Finalizing report...")
+    if demo_pacing:
+        time.sleep(0.3)
 
+    # The three steps finish faster than a render tick apart, so a single
+    # coalesced advance saves two progress re-renders
+    progress.update(task, advance=3)
     progress.remove_task(task)
     log.info("Report generation complete")
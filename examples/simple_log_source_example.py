@@ -14,37 +14,67 @@
 
 """Simplest log source information example - Learn in 3 minutes"""
 
+import functools
 import logging
 import sys
 
-if sys.platform == "win32":
-    import codecs
-
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.buffer, "strict")
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.buffer, "strict")
+from _common import ensure_utf8, fast_mode
 
 from advlog.core.formatter import PlainFormatter
 
-print("=" * 70)
-print("🔍 Log source information display - simplest example")
-print("=" * 70)
+# Reconfigures the existing streams in place on Windows consoles, and
+# only when they are not already UTF-8 - no codecs.StreamWriter proxy
+# adding a decode layer to every print
+ensure_utf8()
+
+# Thread/process/multiprocessing info never appears in these formats, so
+# skip collecting it on every record. The findCaller() frame walk stays
+# on - %(filename)s/%(lineno)d/%(funcName)s is the whole point here. If
+# you wrap these loggers in your own helper, pass stacklevel= so the walk
+# reports your caller instead of the wrapper.
+fast_mode()
+
+
+@functools.lru_cache(maxsize=32)
+def _mk_plain(fmt, datefmt=None):
+    """Build (or reuse) a PlainFormatter for a format-string pair.
+
+    Formatter construction parses the %-style format string; caching by
+    (fmt, datefmt) makes repeated setups - e.g. a logger per request
+    copied from this example - reuse the compiled formatter instead of
+    re-parsing it every time.
+    """
+    return PlainFormatter(fmt=fmt, datefmt=datefmt)
+
+
+# Banner and section headers go out as one write each instead of a
+# write syscall per print line
+_BAR = "=" * 70
+sys.stdout.write("\n".join((_BAR, "🔍 Log source information display - simplest example", _BAR)) + "\n")
+
+
+def _section(title):
+    sys.stdout.write(f"\n{title}\n{'-' * 70}\n")
+
+
+# One stdout handler shared by all four demo loggers. The demos run
+# sequentially, so swapping the formatter between blocks is safe, and it
+# avoids building (and locking) a fresh StreamHandler per block.
+_SHARED_HANDLER = logging.StreamHandler(sys.stdout)
+
 
 # ========== Example 1: Display file name and line number (most commonly used) ==========
-print("\n[Example 1] Display file name and line number")
-print("-" * 70)
+_section("[Example 1] Display file name and line number")
 
-# Create formatter - the key is this line!
-formatter1 = PlainFormatter(
-    fmt="%(asctime)s | %(levelname)-8s | [%(filename)s:%(lineno)d] | %(message)s", datefmt="%H:%M:%S"
-)
+# Create formatter - the key is this line! (The constant datefmt is
+# cheap at log time: PlainFormatter caches formatTime per second, so
+# records in the same second reuse one strftime() result.)
+formatter1 = _mk_plain("%(asctime)s | %(levelname)-8s | [%(filename)s:%(lineno)d] | %(message)s", "%H:%M:%S")
 
 logger1 = logging.getLogger("demo1")
 logger1.setLevel(logging.DEBUG)
-logger1.handlers.clear()
-
-handler1 = logging.StreamHandler(sys.stdout)
-handler1.setFormatter(formatter1)
-logger1.addHandler(handler1)
+logger1.handlers[:] = [_SHARED_HANDLER]
+_SHARED_HANDLER.setFormatter(formatter1)
 
 # Use - will automatically show file name and line number!
 logger1.info("This log shows file name and line number")
@@ -52,18 +82,14 @@ logger1.warning("You can see which line the log is from")
 
 
 # ========== Example 2: Display function name ==========
-print("\n[Example 2] Display function name")
-print("-" * 70)
+_section("[Example 2] Display function name")
 
-formatter2 = PlainFormatter(fmt="%(asctime)s | [%(funcName)s] | %(message)s", datefmt="%H:%M:%S")
+formatter2 = _mk_plain("%(asctime)s | [%(funcName)s] | %(message)s", "%H:%M:%S")
 
 logger2 = logging.getLogger("demo2")
 logger2.setLevel(logging.DEBUG)
-logger2.handlers.clear()
-
-handler2 = logging.StreamHandler(sys.stdout)
-handler2.setFormatter(formatter2)
-logger2.addHandler(handler2)
+logger2.handlers[:] = [_SHARED_HANDLER]
+_SHARED_HANDLER.setFormatter(formatter2)
 
 
 def process_data():
@@ -79,20 +105,14 @@ save_result()
 
 
 # ========== Example 3: Complete information (recommended!) ==========
-print("\n[Example 3] Complete information: file name:line number:function name (recommended)")
-print("-" * 70)
+_section("[Example 3] Complete information: file name:line number:function name (recommended)")
 
-formatter3 = PlainFormatter(
-    fmt="%(asctime)s | [%(filename)s:%(lineno)d:%(funcName)s] | %(message)s", datefmt="%H:%M:%S"
-)
+formatter3 = _mk_plain("%(asctime)s | [%(filename)s:%(lineno)d:%(funcName)s] | %(message)s", "%H:%M:%S")
 
 logger3 = logging.getLogger("demo3")
 logger3.setLevel(logging.DEBUG)
-logger3.handlers.clear()
-
-handler3 = logging.StreamHandler(sys.stdout)
-handler3.setFormatter(formatter3)
-logger3.addHandler(handler3)
+logger3.handlers[:] = [_SHARED_HANDLER]
+_SHARED_HANDLER.setFormatter(formatter3)
 
 
 def main():
@@ -111,18 +131,14 @@ main()
 
 
 # ========== Example 4: Compact format (recommended for development environment) ==========
-print("\n[Example 4] Compact format - recommended for development environment")
-print("-" * 70)
+_section("[Example 4] Compact format - recommended for development environment")
 
-formatter4 = PlainFormatter(fmt="[%(levelname).1s] %(filename)s:%(lineno)d:%(funcName)s() | %(message)s")
+formatter4 = _mk_plain("[%(levelname).1s] %(filename)s:%(lineno)d:%(funcName)s() | %(message)s")
 
 logger4 = logging.getLogger("demo4")
 logger4.setLevel(logging.DEBUG)
-logger4.handlers.clear()
-
-handler4 = logging.StreamHandler(sys.stdout)
-handler4.setFormatter(formatter4)
-logger4.addHandler(handler4)
+logger4.handlers[:] = [_SHARED_HANDLER]
+_SHARED_HANDLER.setFormatter(formatter4)
 
 
 def api_handler():
@@ -135,27 +151,35 @@ api_handler()
 
 
 # ========== Summary ==========
-print("\n" + "=" * 70)
-print("✅ Summary")
-print("=" * 70)
-print()
-print("Displaying log source information is very simple, just add to the format string:")
-print()
-print("  %(filename)s   - File name")
-print("  %(lineno)d     - Line number")
-print("  %(funcName)s   - Function name")
-print()
-print("💡 Recommended formats:")
-print()
-print("  Development environment:")
-print('    "[%(levelname).1s] %(filename)s:%(lineno)d:%(funcName)s() | %(message)s"')
-print()
-print("  Production environment:")
-print('    "%(asctime)s | %(levelname)-8s | [%(filename)s:%(lineno)d] | %(message)s"')
-print()
-print("=" * 70)
-print("🎉 It's that simple!")
-print("=" * 70)
-print()
-print("📖 View more examples: python demo_log_source.py")
-print("📖 Complete guide: LOG_SOURCE_GUIDE.md")
+_FOOTER = "\n".join(
+    (
+        "",
+        _BAR,
+        "✅ Summary",
+        _BAR,
+        "",
+        "Displaying log source information is very simple, just add to the format string:",
+        "",
+        "  %(filename)s   - File name",
+        "  %(lineno)d     - Line number",
+        "  %(funcName)s   - Function name",
+        "",
+        "💡 Recommended formats:",
+        "",
+        "  Development environment:",
+        '    "[%(levelname).1s] %(filename)s:%(lineno)d:%(funcName)s() | %(message)s"',
+        "",
+        "  Production environment:",
+        '    "%(asctime)s | %(levelname)-8s | [%(filename)s:%(lineno)d] | %(message)s"',
+        "",
+        _BAR,
+        "🎉 It's that simple!",
+        _BAR,
+        "",
+        "📖 View more examples: python demo_log_source.py",
+        "📖 Complete guide: LOG_SOURCE_GUIDE.md",
+        "",
+    )
+)
+sys.stdout.write(_FOOTER)
+sys.stdout.flush()
@@ -17,31 +17,52 @@
 Test script to demonstrate breakpoint continue (append) functionality.
 """
 
+import os
 import sys
+from collections import deque
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-# Find the latest log file
-import glob
-import os
-
 from advlog import get_logger, initialize
 
-log_files = glob.glob("logs/logs/2026-01-02/*demo_workflow.log")
-if not log_files:
+# Find the latest log file
+# One scandir pass instead of glob + a stat() per candidate:
+# DirEntry.stat() reuses the metadata the directory iteration already
+# fetched, so picking the newest file costs no extra syscalls
+best = None
+try:
+    with os.scandir("logs/logs/2026-01-02") as it:
+        best = max(
+            (e for e in it if e.name.endswith("demo_workflow.log")),
+            key=lambda e: e.stat().st_ctime,
+            default=None,
+        )
+except FileNotFoundError:
+    pass
+
+if best is None:
     print("No existing log file found. Creating a new one...")
     latest_log = None
 else:
-    latest_log = max(log_files, key=os.path.getctime)
+    latest_log = best.path
     print(f"Found existing log file: {latest_log}")
-    print(f"Size before: {os.path.getsize(latest_log)} bytes")
+    print(f"Size before: {best.stat().st_size} bytes")
 
-print("\n" + "=" * 70)
-print("Testing Breakpoint Continue (Append Mode)")
-print("=" * 70)
-print("\nInitializing logger with same session_name...")
-print("This will append to the existing log file.\n")
+sys.stdout.write(
+    "\n".join(
+        (
+            "",
+            "=" * 70,
+            "Testing Breakpoint Continue (Append Mode)",
+            "=" * 70,
+            "",
+            "Initializing logger with same session_name...",
+            "This will append to the existing log file.\n\n",
+        )
+    )
+)
+sys.stdout.flush()
 
 # Use same session_name to target the same file
 initialize(
@@ -59,15 +80,25 @@ log.info("If you see this in the log file, the feature works correctly.")
 log.info("=" * 70)
 
 if latest_log:
-    print("\n[OK] New log entries written!")
-    print(f"Size after: {os.path.getsize(latest_log)} bytes")
-    print("\nLast 5 lines of the log file:")
-    print("-" * 70)
+    sys.stdout.write(
+        "\n".join(
+            (
+                "",
+                "[OK] New log entries written!",
+                f"Size after: {os.stat(latest_log).st_size} bytes",
+                "",
+                "Last 5 lines of the log file:",
+                "-" * 70 + "\n",
+            )
+        )
+    )
+    # deque(f, maxlen=5) streams the file line by line and keeps only the
+    # tail resident, instead of materializing every line just to slice it
     with open(latest_log, encoding="utf-8") as f:
-        lines = f.readlines()
-        for line in lines[-5:]:
-            print(line.rstrip())
-    print("-" * 70)
-    print("\n[SUCCESS] Breakpoint continue (append mode) test PASSED!")
+        tail = deque(f, maxlen=5)
+    sys.stdout.write("".join(tail))
+    if tail and not tail[-1].endswith("\n"):
+        sys.stdout.write("\n")
+    sys.stdout.write("-" * 70 + "\n\n[SUCCESS] Breakpoint continue (append mode) test PASSED!\n")
 else:
     print("\n[SUCCESS] New log file created successfully!")
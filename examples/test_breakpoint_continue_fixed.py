@@ -21,13 +21,12 @@ This demonstrates:
 2. Continuing to the SAME log file by specifying its exact path
 """
 
+import os
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-import os
-
 from advlog import get_logger, initialize
 
 
@@ -52,8 +51,10 @@ def test_correct_breakpoint_continue():
     print(f"[OK] Created: {log_file_path}")
     print()
 
-    # Check file size
-    size_after_first = os.path.getsize(log_file_path)
+    # Check file size (os.stat directly - getsize is just a wrapper
+    # around it; the two stats here bracket the append, so each reflects
+    # a distinct point in time and cannot be coalesced)
+    size_after_first = os.stat(log_file_path).st_size
     print(f"File size after first run: {size_after_first} bytes")
     print()
 
@@ -71,22 +72,33 @@ def test_correct_breakpoint_continue():
     print()
 
     # Check file size
-    size_after_second = os.path.getsize(log_file_path)
+    size_after_second = os.stat(log_file_path).st_size
     print(f"File size after second run: {size_after_second} bytes")
     print(f"Added: {size_after_second - size_after_first} bytes")
     print()
 
-    # Display the log file content
+    # Display the log file content, streaming 64KB chunks straight to the
+    # stdout buffer instead of holding the whole file in memory; the
+    # marker checks scan each chunk plus a small carry so a marker split
+    # across a chunk boundary is still found
     print("Content of the log file:")
     print("-" * 70)
-    with open(log_file_path, encoding="utf-8") as f:
-        content = f.read()
-        print(content)
+    sys.stdout.flush()
+    first_found = second_found = False
+    carry = b""
+    with open(log_file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            sys.stdout.buffer.write(chunk)
+            window = carry + chunk
+            first_found = first_found or b"FIRST RUN" in window
+            second_found = second_found or b"SECOND RUN" in window
+            carry = chunk[-16:]
+    sys.stdout.buffer.flush()
     print("-" * 70)
     print()
 
     # Verify the content
-    if "FIRST RUN" in content and "SECOND RUN" in content:
+    if first_found and second_found:
         print("[SUCCESS] Both runs are in the same file.")
         print("[SUCCESS] Breakpoint continue works correctly!")
         return True
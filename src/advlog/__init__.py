@@ -64,6 +64,8 @@ Modules:
 __version__ = "0.1.0"
 __author__ = "Mengzhao Wang"
 
+import sys
+
 # Core imports
 from .core import (
     AdvancedLogger,
@@ -88,18 +90,6 @@ from .handlers import (
     create_file_handler,
 )
 
-# Plugin imports (with graceful degradation)
-try:
-    from .plugins import (
-        ProgressTracker,
-        TrainingLogger,
-        create_progress_bar,
-    )
-
-    PLUGINS_AVAILABLE = True
-except ImportError:
-    PLUGINS_AVAILABLE = False
-
 # Utility imports
 # Global management API (replaces old get_logger)
 from .setup import (
@@ -115,6 +105,67 @@ from .utils import (
     supports_color,
 )
 
+# Plugin exports are resolved lazily via __getattr__ below so importing
+# advlog doesn't pull in Rich and the other optional plugin dependencies.
+_PLUGIN_EXPORTS = frozenset({
+    "BufferedProgressTracker",
+    "ProgressTracker",
+    "TrainingLogger",
+    "create_progress_bar",
+})
+
+
+def __getattr__(name):
+    """Resolve plugin attributes on first access (PEP 562).
+
+    Args:
+        name: Attribute being looked up
+
+    Returns:
+        The resolved plugin attribute
+
+    Raises:
+        AttributeError: If the attribute is not a known lazy export
+    """
+    if name in _PLUGIN_EXPORTS:
+        from . import plugins
+
+        value = getattr(plugins, name)
+        globals()[name] = value
+        return value
+    if name == "PLUGINS_AVAILABLE":
+        import importlib.util
+
+        available = importlib.util.find_spec("rich") is not None
+        globals()[name] = available
+        return available
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_UTF8_CONFIGURED = False
+
+
+def ensure_utf8_stdio() -> None:
+    """Reconfigure stdout/stderr to UTF-8 on Windows consoles.
+
+    Uses TextIOWrapper.reconfigure() on the existing streams rather than
+    rebinding sys.stdout/sys.stderr, so the original stream objects and
+    their buffering stay intact. Safe to call repeatedly; only the first
+    call does any work.
+    """
+    global _UTF8_CONFIGURED
+    if _UTF8_CONFIGURED or sys.platform != "win32":
+        return
+    for stream in (sys.stdout, sys.stderr):
+        # Already UTF-8 (PYTHONUTF8=1, PYTHONIOENCODING=utf-8, or a
+        # modern console): leave the stream untouched
+        if (getattr(stream, "encoding", "") or "").lower() in ("utf-8", "utf8"):
+            continue
+        if hasattr(stream, "reconfigure"):
+            stream.reconfigure(encoding="utf-8", errors="strict")
+    _UTF8_CONFIGURED = True
+
+
 # Define public API
 __all__ = [
     # Version
@@ -138,6 +189,7 @@ __all__ = [
     "create_console_handler",
     "create_file_handler",
     # Plugins
+    "BufferedProgressTracker",
     "ProgressTracker",
     "create_progress_bar",
     "TrainingLogger",
@@ -151,4 +203,5 @@ __all__ = [
     "get_logger",
     "get_progress",
     "reset",
+    "ensure_utf8_stdio",
 ]
@@ -32,6 +32,8 @@ class LoggerConfig:
         console_output: Enable console output
         enable_progress: Enable progress bar support
         enable_rich_tracebacks: Enable rich formatted tracebacks
+        async_logging: Route records through a background queue listener so
+            log calls only enqueue; formatting and I/O happen off-thread
         max_file_size: Maximum log file size in bytes (for rotation)
         backup_count: Number of backup files to keep when rotating
         separate_error_file: Path to separate error log file
@@ -61,6 +63,7 @@ class LoggerConfig:
     console_output: bool = True
     enable_progress: bool = True
     enable_rich_tracebacks: bool = True
+    async_logging: bool = False
 
     # File rotation
     max_file_size: Optional[int] = None  # bytes, None means no rotation
@@ -14,14 +14,139 @@
 
 """Custom formatters for log messages."""
 
+import copy
+import json
 import logging
+import re
+import time
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Optional
 
+try:
+    # Optional C JSON encoder (install with advlog-core[perf]); several
+    # times faster than stdlib json on dict-heavy payloads
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    # orjson emits compact separators; the hand-built prefix must match
+    _JSON_TS_TEMPLATE = '{{"timestamp":"{}",{}{}'
+    _JSON_ITEM_SEP = ","
+else:
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _JSON_TS_TEMPLATE = '{{"timestamp": "{}", {}{}'
+    _JSON_ITEM_SEP = ", "
+
+# Matches "%(name)s"-style tokens, capturing the field name, the optional
+# flags/width/precision part, and the conversion type.
+_FMT_TOKEN = re.compile(r"%\(([A-Za-z_][A-Za-z0-9_]*)\)([-+ #0-9.]*)([diouxXeEfFgGcrsa])")
+
+
+@lru_cache(maxsize=64)
+def _compile_fmt(fmt: str):
+    """Pre-parse a %-style format string into (literal, field, spec) tuples.
+
+    The stdlib re-scans the format string on every ``format()`` call; parsing
+    it once at formatter construction amortizes that cost across all records.
+
+    Args:
+        fmt: %-style format string (e.g. "%(asctime)s [%(levelname)s] %(message)s")
+
+    Returns:
+        Tuple of ((literal, field, spec), ...) entries plus the trailing
+        literal, or None if the format string contains constructs the fast
+        path cannot reproduce (callers should fall back to the stdlib).
+    """
+    plan = []
+    pos = 0
+    for match in _FMT_TOKEN.finditer(fmt):
+        literal = fmt[pos:match.start()]
+        if "%" in literal.replace("%%", ""):
+            return None
+        plan.append((literal.replace("%%", "%"), match.group(1), "%" + match.group(2) + match.group(3)))
+        pos = match.end()
+    tail = fmt[pos:]
+    if "%" in tail.replace("%%", ""):
+        return None
+    return tuple(plan), tail.replace("%%", "%")
+
 
 # === Base Formatters ===
 
-class RichColorFormatter(logging.Formatter):
+class _CompiledFormatter(logging.Formatter):
+    """Formatter base that renders records from a pre-compiled format plan.
+
+    The stdlib re-parses the %-style format string inside every
+    ``format()`` call. Subclasses get a plan compiled once at construction
+    (literal pieces plus field specs) and a ``formatMessage`` that just
+    joins the pieces; format strings the compiler cannot handle fall back
+    to the stdlib path.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        self._plan = _compile_fmt(fmt) if fmt else None
+        # (seconds, datefmt, formatted) for the 1-second timestamp cache
+        self._time_cache = (-1, None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format the record timestamp, reusing it within the same second.
+
+        Explicit date formats have whole-second resolution, so records
+        created in the same second share one strftime() call instead of
+        re-rendering an identical timestamp each time.
+
+        Args:
+            record: Log record supplying the creation time
+            datefmt: Date format string (defaults to the formatter's)
+
+        Returns:
+            Formatted timestamp
+        """
+        fmt = datefmt or self.datefmt
+        if fmt is None:
+            # Sub-second default format; can't cache per second
+            return super().formatTime(record, datefmt)
+
+        seconds = int(record.created)
+        cached_seconds, cached_fmt, cached_str = self._time_cache
+        if seconds == cached_seconds and fmt == cached_fmt:
+            return cached_str
+
+        formatted = time.strftime(fmt, self.converter(record.created))
+        self._time_cache = (seconds, fmt, formatted)
+        return formatted
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Format the record fields using the pre-parsed format plan.
+
+        Args:
+            record: Log record to format
+
+        Returns:
+            Formatted log line (without exception/stack text)
+        """
+        if self._plan is None:
+            return super().formatMessage(record)
+
+        plan, tail = self._plan
+        values = record.__dict__
+        parts = []
+        for literal, field, spec in plan:
+            parts.append(literal)
+            parts.append(spec % (values[field],))
+        parts.append(tail)
+        return "".join(parts)
+
+
+class RichColorFormatter(_CompiledFormatter):
     """Formatter that adds Rich markup for colored output.
 
     This formatter wraps log messages with Rich color markup tags
@@ -77,7 +202,7 @@ class RichColorFormatter(logging.Formatter):
         return message
 
 
-class PlainFormatter(logging.Formatter):
+class PlainFormatter(_CompiledFormatter):
     """Plain formatter without any color codes.
 
     This is useful for file output where color codes would be unreadable.
@@ -152,6 +277,33 @@ class IndentedFormatter(logging.Formatter):
         return message
 
 
+# LogRecord attributes that are part of every record and therefore not
+# "extras"; anything else in record.__dict__ came from the log call.
+_RECORD_BUILTIN_ATTRS = frozenset({
+    "name",
+    "msg",
+    "args",
+    "created",
+    "filename",
+    "funcName",
+    "levelname",
+    "levelno",
+    "lineno",
+    "module",
+    "msecs",
+    "message",
+    "pathname",
+    "process",
+    "processName",
+    "relativeCreated",
+    "thread",
+    "threadName",
+    "exc_info",
+    "exc_text",
+    "stack_info",
+})
+
+
 class JSONFormatter(logging.Formatter):
     """Formatter that outputs log records as JSON.
 
@@ -169,6 +321,24 @@ class JSONFormatter(logging.Formatter):
         super().__init__()
         self.include_extras = include_extras
 
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _level_logger_fragment(levelname: str, name: str) -> str:
+        """Serialize the level/logger pair once per (level, logger) combo.
+
+        These two fields repeat on virtually every record a given logger
+        emits, so the escaped fragment is cached instead of re-serialized
+        per record.
+
+        Args:
+            levelname: Record level name
+            name: Logger name
+
+        Returns:
+            Pre-serialized '"level": ..., "logger": ..., ' fragment
+        """
+        return _json_dumps({"level": levelname, "logger": name})[1:-1] + _JSON_ITEM_SEP
+
     def format(self, record: logging.LogRecord) -> str:
         """Format the log record as JSON.
 
@@ -178,13 +348,7 @@ class JSONFormatter(logging.Formatter):
         Returns:
             JSON-formatted log message
         """
-        import json
-        from datetime import datetime
-
         log_data = {
-            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
-            "level": record.levelname,
-            "logger": record.name,
             "message": record.getMessage(),
             "module": record.module,
             "function": record.funcName,
@@ -199,32 +363,16 @@ class JSONFormatter(logging.Formatter):
         if self.include_extras:
             # Add any extra fields that were passed to the log call
             for key, value in record.__dict__.items():
-                if key not in [
-                    "name",
-                    "msg",
-                    "args",
-                    "created",
-                    "filename",
-                    "funcName",
-                    "levelname",
-                    "levelno",
-                    "lineno",
-                    "module",
-                    "msecs",
-                    "message",
-                    "pathname",
-                    "process",
-                    "processName",
-                    "relativeCreated",
-                    "thread",
-                    "threadName",
-                    "exc_info",
-                    "exc_text",
-                    "stack_info",
-                ]:
+                if key not in _RECORD_BUILTIN_ATTRS:
                     log_data[key] = value
 
-        return json.dumps(log_data, ensure_ascii=False)
+        # Stitch the cached level/logger fragment between the timestamp and
+        # the per-record tail; the encoder only runs over fields that change
+        timestamp = datetime.fromtimestamp(record.created).isoformat()
+        tail = _json_dumps(log_data)[1:]
+        return _JSON_TS_TEMPLATE.format(
+            timestamp, self._level_logger_fragment(record.levelname, record.name), tail
+        )
 
 
 # === Aligned Formatters ===
@@ -313,66 +461,98 @@ class AlignedFormatter(logging.Formatter):
         self.show_name = show_name
         self.show_location = show_location
 
-    def _align_field(self, text: str, width: Optional[int], align: str) -> str:
-        """Align field
+        self._build_row()
+
+    @staticmethod
+    def _field_spec(width: Optional[int], align: str) -> str:
+        """Build a str.format() placeholder for one field.
+
+        A minimum-width spec pads but never truncates, matching the old
+        ljust/rjust/center behavior for over-long values.
 
         Args:
-            text: Text content
-            width: Width (None=no alignment)
-            align: Alignment method
+            width: Field width (None=no alignment)
+            align: Alignment method ("left", "right" or "center")
 
         Returns:
-            Aligned text
+            Placeholder string (e.g. "{:<12}")
         """
         if width is None:
-            return text
-
-        # When text exceeds width, don't truncate, return original text
-        if len(text) > width:
-            return text
-
-        if align == "left":
-            return text.ljust(width)
-        elif align == "right":
-            return text.rjust(width)
-        elif align == "center":
-            return text.center(width)
-        else:
-            return text.ljust(width)
+            return "{}"
+        align_char = {"left": "<", "right": ">", "center": "^"}.get(align, "<")
+        return "{:%s%d}" % (align_char, width)
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record"""
-        parts = []
+    def _build_row(self) -> None:
+        """Precompute the row template from the current field settings.
 
-        # Time
-        if self.show_time:
-            time_str = self.formatTime(record, self.datefmt)
-            time_str = self._align_field(time_str, self.time_width, self.align_time)
-            parts.append(time_str)
+        Translates the width/alignment options into str.format() specs once,
+        so format() is a single template fill instead of per-record padding
+        calls. Must be re-run after any field attribute changes.
+        """
+        specs = []
+        fields = []
 
-        # Log level
+        if self.show_time:
+            specs.append(self._field_spec(self.time_width, self.align_time))
+            fields.append("time")
         if self.show_level:
-            level_str = self._align_field(record.levelname, self.level_width, self.align_level)
-            parts.append(level_str)
-
-        # Logger name
+            specs.append(self._field_spec(self.level_width, self.align_level))
+            fields.append("level")
         if self.show_name:
-            name_str = self._align_field(record.name, self.name_width, self.align_name)
-            parts.append(name_str)
-
-        # Source location
+            specs.append(self._field_spec(self.name_width, self.align_name))
+            fields.append("name")
         if self.show_location:
-            location = f"{record.filename}:{record.lineno}:{record.funcName}"
-            location_str = self._align_field(location, self.location_width, self.align_location)
-            parts.append(f"[{location_str}]")
+            specs.append("[" + self._field_spec(self.location_width, self.align_location) + "]")
+            fields.append("location")
 
-        # Message
-        message = record.getMessage()
         if self.message_width:
-            message = self._align_field(message, self.message_width, self.align_message)
-        parts.append(message)
+            specs.append(self._field_spec(self.message_width, self.align_message))
+        else:
+            specs.append("{}")
 
-        return self.separator.join(parts)
+        self._row = self.separator.join(specs)
+        self._fields = tuple(fields)
+
+    def clone(self, **overrides) -> "AlignedFormatter":
+        """Return a copy with some field settings changed.
+
+        Cheaper than re-running __init__ for each style variant, and makes
+        deriving formatters from a shared base explicit.
+
+        Args:
+            **overrides: Attribute values to change (same names as __init__)
+
+        Returns:
+            New AlignedFormatter with the overrides applied
+
+        Example:
+            base = AlignedFormatter(time_width=12)
+            right = base.clone(align_time="right", align_level="right")
+        """
+        other = copy.copy(self)
+        for key, value in overrides.items():
+            if not hasattr(other, key):
+                raise AttributeError(f"Unknown AlignedFormatter option: {key}")
+            setattr(other, key, value)
+        other._build_row()
+        return other
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record"""
+        values = []
+
+        for field in self._fields:
+            if field == "time":
+                values.append(self.formatTime(record, self.datefmt))
+            elif field == "level":
+                values.append(record.levelname)
+            elif field == "name":
+                values.append(record.name)
+            else:  # location
+                values.append(f"{record.filename}:{record.lineno}:{record.funcName}")
+
+        values.append(record.getMessage())
+        return self._row.format(*values)
 
 
 class TableFormatter(logging.Formatter):
@@ -399,20 +579,17 @@ class TableFormatter(logging.Formatter):
         self.level_width = level_width
         self.location_width = location_width
         self._header_printed = False
+        # Bake the column widths into one row template up front
+        self._row = f"{{:<{time_width}}} | {{:<{level_width}}} | [{{:<{location_width}}}] | {{}}"
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record"""
-        # Format fields
-        time_str = self.formatTime(record, self.datefmt).ljust(self.time_width)
-        level_str = record.levelname.ljust(self.level_width)
-
-        location = f"{record.filename}:{record.lineno}:{record.funcName}"
-        location_str = location.ljust(self.location_width)
-
-        message = record.getMessage()
-
-        # Combine output
-        return f"{time_str} | {level_str} | [{location_str}] | {message}"
+        return self._row.format(
+            self.formatTime(record, self.datefmt),
+            record.levelname,
+            f"{record.filename}:{record.lineno}:{record.funcName}",
+            record.getMessage(),
+        )
 
 
 class CompactFormatter(logging.Formatter):
@@ -432,19 +609,27 @@ class CompactFormatter(logging.Formatter):
         """Initialize compact formatter"""
         super().__init__(datefmt=datefmt)
         self.location_width = location_width
+        # Bake the location width into one row template up front
+        self._row = f"[{{}}] {{:<{location_width}}} | {{}}"
 
     def format(self, record: logging.LogRecord) -> str:
         """Format log record"""
-        # Level (single character)
-        level_char = record.levelname[0]
-
-        # Location
-        location = f"{record.filename}:{record.lineno}"
-        location_str = location.ljust(self.location_width)
+        return self._row.format(
+            record.levelname[0],
+            f"{record.filename}:{record.lineno}",
+            record.getMessage(),
+        )
 
-        message = record.getMessage()
 
-        return f"[{level_char}] {location_str} | {message}"
+# Per-column value extractors for ColumnFormatter, resolved once at
+# construction instead of an if/elif chain per column per record
+_COLUMN_GETTERS = {
+    "time": lambda fmt, record: fmt.formatTime(record, fmt.datefmt),
+    "level": lambda fmt, record: record.levelname,
+    "name": lambda fmt, record: record.name,
+    "location": lambda fmt, record: f"[{record.filename}:{record.lineno}:{record.funcName}]",
+    "message": lambda fmt, record: record.getMessage(),
+}
 
 
 class ColumnFormatter(logging.Formatter):
@@ -492,33 +677,24 @@ class ColumnFormatter(logging.Formatter):
         self.widths = widths
         self.separator = separator
 
+        # Resolve column dispatch and width specs once up front
+        specs = []
+        getters = []
+        for col in columns:
+            width = widths.get(col)
+            specs.append("{}" if width is None else f"{{:<{width}}}")
+            getters.append(_COLUMN_GETTERS.get(col, lambda fmt, record: ""))
+        self._row = separator.join(specs)
+        self._getters = tuple(getters)
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record"""
-        parts = []
+        return self._row.format(*[getter(self, record) for getter in self._getters])
 
-        for col in self.columns:
-            width = self.widths.get(col)
 
-            if col == "time":
-                text = self.formatTime(record, self.datefmt)
-            elif col == "level":
-                text = record.levelname
-            elif col == "name":
-                text = record.name
-            elif col == "location":
-                text = f"[{record.filename}:{record.lineno}:{record.funcName}]"
-            elif col == "message":
-                text = record.getMessage()
-            else:
-                text = ""
-
-            # Apply width
-            if width is not None:
-                text = text.ljust(width)
-
-            parts.append(text)
-
-        return self.separator.join(parts)
+# Default instances are stateless and safe to share between handlers, so the
+# factory reuses one per style instead of re-running each constructor.
+_DEFAULT_ALIGNED_FORMATTERS: Dict[str, logging.Formatter] = {}
 
 
 def create_aligned_formatter(style: str = "standard", **kwargs) -> logging.Formatter:
@@ -545,13 +721,20 @@ def create_aligned_formatter(style: str = "standard", **kwargs) -> logging.Forma
         # Compact format
         formatter = create_aligned_formatter("compact", location_width=30)
     """
+    if not kwargs and style in _DEFAULT_ALIGNED_FORMATTERS:
+        return _DEFAULT_ALIGNED_FORMATTERS[style]
+
     if style == "standard":
-        return AlignedFormatter(**kwargs)
+        formatter = AlignedFormatter(**kwargs)
     elif style == "table":
-        return TableFormatter(**kwargs)
+        formatter = TableFormatter(**kwargs)
     elif style == "compact":
-        return CompactFormatter(**kwargs)
+        formatter = CompactFormatter(**kwargs)
     elif style == "column":
-        return ColumnFormatter(**kwargs)
+        formatter = ColumnFormatter(**kwargs)
     else:
-        return AlignedFormatter(**kwargs)
+        formatter = AlignedFormatter(**kwargs)
+
+    if not kwargs:
+        _DEFAULT_ALIGNED_FORMATTERS[style] = formatter
+    return formatter
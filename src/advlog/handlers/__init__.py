@@ -14,13 +14,17 @@
 
 """Handler modules for different output targets."""
 
+from .buffered import BufferedStreamHandler, create_buffered_stream_handler
 from .console import ConsoleHandler, create_console_handler
-from .file import FileHandler, RotatingFileHandler, create_file_handler
+from .file import BatchingFileHandler, FileHandler, RotatingFileHandler, create_file_handler
 
 __all__ = [
+    "BatchingFileHandler",
+    "BufferedStreamHandler",
     "ConsoleHandler",
     "FileHandler",
     "RotatingFileHandler",
+    "create_buffered_stream_handler",
     "create_console_handler",
     "create_file_handler",
 ]
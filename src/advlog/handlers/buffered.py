@@ -0,0 +1,94 @@
+# Copyright 2026 Mengzhao Wang
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Buffered stream handler for high-volume console output."""
+
+import atexit
+import logging
+import sys
+from typing import Optional
+
+
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that skips the per-record flush.
+
+    The stdlib StreamHandler flushes the stream after every record, which
+    forces a syscall per log line. This handler relies on the stream's own
+    buffering and only flushes when a record at or above ``flush_level``
+    arrives (so warnings and errors still appear immediately), on close,
+    and at interpreter exit.
+
+    Writing through the existing text stream (rather than wrapping the raw
+    byte buffer) keeps log lines correctly interleaved with plain print()
+    output on the same stream.
+
+    Args:
+        stream: Stream to write to (defaults to sys.stdout)
+        flush_level: Minimum level that triggers an immediate flush
+
+    Example:
+        handler = BufferedStreamHandler(sys.stdout)
+        handler.setFormatter(PlainFormatter())
+        logger.addHandler(handler)
+    """
+
+    def __init__(self, stream=None, flush_level: int = logging.WARNING):
+        if stream is None:
+            stream = sys.stdout
+        super().__init__(stream)
+        self.flush_level = flush_level
+        atexit.register(self.flush)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Emit a record without flushing unless it is urgent.
+
+        Args:
+            record: Log record to emit
+        """
+        try:
+            msg = self.format(record)
+            self.stream.write(msg + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def create_buffered_stream_handler(
+    stream=None,
+    flush_level: int = logging.WARNING,
+    log_level: int = logging.DEBUG,
+    formatter: Optional[logging.Formatter] = None,
+) -> BufferedStreamHandler:
+    """Convenience function to create a buffered stream handler.
+
+    Args:
+        stream: Stream to write to (defaults to sys.stdout)
+        flush_level: Minimum level that triggers an immediate flush
+        log_level: Minimum log level to handle
+        formatter: Formatter to attach (optional)
+
+    Returns:
+        Configured buffered stream handler
+
+    Example:
+        handler = create_buffered_stream_handler(formatter=AlignedFormatter())
+    """
+    handler = BufferedStreamHandler(stream, flush_level=flush_level)
+    handler.setLevel(log_level)
+    if formatter is not None:
+        handler.setFormatter(formatter)
+    return handler
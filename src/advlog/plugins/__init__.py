@@ -12,13 +12,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Plugin modules for extended functionality."""
+"""Plugin modules for extended functionality.
 
-from .progress import ProgressTracker, create_progress_bar
-from .training import TrainingLogger
+Plugin attributes are resolved lazily (PEP 562) so importing this package
+does not pull in heavy optional dependencies such as Rich; they only load
+when a plugin is actually accessed.
+"""
+
+from importlib import import_module
+
+# Exported attribute -> submodule that defines it
+_LAZY_EXPORTS = {
+    "BufferedProgressTracker": "progress",
+    "ProgressTracker": "progress",
+    "create_progress_bar": "progress",
+    "TrainingLogger": "training",
+}
 
 __all__ = [
+    "BufferedProgressTracker",
     "ProgressTracker",
     "create_progress_bar",
     "TrainingLogger",
 ]
+
+
+def __getattr__(name):
+    """Import plugin attributes on first access.
+
+    Args:
+        name: Attribute being looked up
+
+    Returns:
+        The resolved plugin attribute
+
+    Raises:
+        AttributeError: If the attribute is not a known plugin export
+    """
+    submodule = _LAZY_EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    # Cache on the package so subsequent lookups skip __getattr__
+    globals()[name] = value
+    return value
@@ -14,6 +14,7 @@
 
 """Progress bar management - auto cleanup and lifecycle management."""
 
+import time
 from typing import Dict, Optional
 
 from rich.progress import Progress, TaskID
@@ -143,7 +144,31 @@ class ProgressTracker:
             **kwargs: Args passed to Progress.update
         """
         self.progress.update(task_id, **kwargs)
+        self._maybe_auto_remove(task_id)
 
+    def update_many(self, pairs):
+        """Advance several tasks under a single lock acquisition.
+
+        Tasks updated in lockstep (e.g. a stage task plus an overall task)
+        would otherwise take the live-display lock once per task per
+        iteration. This takes it once per batch and leaves rendering to
+        the refresh thread.
+
+        Args:
+            pairs: Iterable of (task_id, advance) tuples
+        """
+        with self.progress._lock:
+            for task_id, advance in pairs:
+                self.progress.update(task_id, advance=advance, refresh=False)
+        for task_id, _ in pairs:
+            self._maybe_auto_remove(task_id)
+
+    def _maybe_auto_remove(self, task_id: TaskID):
+        """Apply the auto-remove policy after an update.
+
+        Args:
+            task_id: Task ID that was just updated
+        """
         # Check if task is completed
         if self.auto_remove_completed and task_id in self.tasks:
             # Get task object
@@ -185,6 +210,24 @@ class ProgressTracker:
                 self.progress.remove_task(task_id)
                 del self.tasks[task_id]
 
+    def finish_task(self, task_id: TaskID, keep: bool = False):
+        """Complete a task and hide its row without removing it.
+
+        remove_task() makes the live display re-layout the remaining task
+        table; flipping visibility is a single attribute update, which is
+        noticeably cheaper when many short-lived tasks churn through a
+        loop. The task stays registered, so its info remains queryable.
+
+        Args:
+            task_id: Task ID
+            keep: Keep the completed row visible
+        """
+        info = self.tasks.get(task_id)
+        if info is None:
+            return
+        self.progress.update(task_id, completed=info["total"], visible=keep)
+        info["completed"] = True
+
     def remove_task(self, task_id: TaskID):
         """Manually remove task.
 
@@ -255,6 +298,77 @@ class ProgressTracker:
         return len(self.completed_tasks)
 
 
+class BufferedProgressTracker(ProgressTracker):
+    """Progress tracker that coalesces rapid advance-only updates.
+
+    Tight loops calling ``update(task, advance=1)`` per item re-render the
+    progress bar (and write to the terminal) on every iteration. This
+    tracker accumulates advances in an integer counter per task and only
+    pushes them to the underlying Progress when ``flush_interval`` seconds
+    have elapsed, cutting render/write calls roughly to one per interval.
+
+    Updates with other keyword arguments (description changes, explicit
+    completed values) are not coalesced; they flush pending advances first
+    and pass through immediately.
+
+    Usage:
+        with BufferedProgressTracker() as progress:
+            task = progress.add_task("Processing", total=100000)
+            for item in items:
+                process(item)
+                progress.update(task, advance=1)  # cheap accumulate
+    """
+
+    def __init__(self, *args, flush_interval: float = 0.05, **kwargs):
+        """Initialize the buffered tracker.
+
+        Args:
+            *args: Positional args passed to ProgressTracker
+            flush_interval: Minimum seconds between renders
+            **kwargs: Keyword args passed to ProgressTracker
+        """
+        super().__init__(*args, **kwargs)
+        self.flush_interval = flush_interval
+        self._pending: Dict[TaskID, float] = {}
+        self._last_flush = time.monotonic()
+
+    def update(self, task_id: TaskID, advance: Optional[float] = None, **kwargs):
+        """Update task progress, coalescing advance-only updates.
+
+        Args:
+            task_id: Task ID
+            advance: Amount to advance the task by
+            **kwargs: Other args passed to Progress.update (forces a flush)
+        """
+        if kwargs or advance is None:
+            # Non-advance updates carry state we can't buffer
+            self.flush()
+            super().update(task_id, advance=advance, **kwargs)
+            return
+
+        self._pending[task_id] = self._pending.get(task_id, 0) + advance
+        now = time.monotonic()
+        if now - self._last_flush >= self.flush_interval:
+            self.flush(now)
+
+    def flush(self, now: Optional[float] = None):
+        """Push accumulated advances to the underlying progress bar.
+
+        Args:
+            now: Current monotonic time, if the caller already has it
+        """
+        if self._pending:
+            pending, self._pending = self._pending, {}
+            for task_id, advance in pending.items():
+                super().update(task_id, advance=advance)
+        self._last_flush = time.monotonic() if now is None else now
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Flush pending advances before closing the progress bar."""
+        self.flush()
+        return super().__exit__(exc_type, exc_val, exc_tb)
+
+
 def create_progress_bar(
     auto_remove_completed: bool = False,
     keep_recent: int = 0,
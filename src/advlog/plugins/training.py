@@ -14,6 +14,7 @@
 
 """Training-specific logging utilities."""
 
+import atexit
 import csv
 import logging
 import os
@@ -28,6 +29,9 @@ try:
 except ImportError:
     OMEGACONF_AVAILABLE = False
 
+# Rows written to a metrics CSV between explicit flushes
+_CSV_FLUSH_EVERY = 64
+
 try:
     from torchinfo import summary
 
@@ -63,6 +67,14 @@ class TrainingLogger:
         """
         self.logger = logger
         self._history = []
+        # Per-path open CSV files: path -> [writer, file, rows_since_flush].
+        # Keeping the file open across steps avoids an open/close syscall
+        # pair per training step; rows are flushed every _CSV_FLUSH_EVERY.
+        self._csv_files: Dict[str, list] = {}
+        # (id(config), title) -> (config, rendered text). The config object
+        # is kept in the value so its id can't be recycled while cached.
+        self._config_cache: Dict[tuple, tuple] = {}
+        atexit.register(self.close)
 
     def log_configuration(self, config: Any, title: str = "Hyperparameters"):
         """Log configuration/hyperparameters.
@@ -74,47 +86,59 @@ class TrainingLogger:
         Example:
             trainer.log_configuration(cfg, title="Training Config")
         """
-        self.logger.info(f"===== {title} =====")
-
-        if OMEGACONF_AVAILABLE and hasattr(config, "__module__"):
-            # Try to detect OmegaConf objects
-            if "omegaconf" in config.__module__:
-                self.logger.info(OmegaConf.to_yaml(config))
+        # Configs are usually static for a run (and often reused across
+        # sweeps), so the rendered section is cached and repeat calls cost
+        # one log call instead of re-walking the whole config
+        key = (id(config), title)
+        cached = self._config_cache.get(key)
+        if cached is None or cached[0] is not config:
+            lines = [f"===== {title} ====="]
+
+            if OMEGACONF_AVAILABLE and hasattr(config, "__module__"):
+                # Try to detect OmegaConf objects
+                if "omegaconf" in config.__module__:
+                    lines.append(OmegaConf.to_yaml(config))
+                else:
+                    self._render_generic_config(config, lines)
+            elif isinstance(config, dict):
+                self._render_dict_config(config, lines)
             else:
-                self._log_generic_config(config)
-        elif isinstance(config, dict):
-            self._log_dict_config(config)
-        else:
-            self._log_generic_config(config)
+                self._render_generic_config(config, lines)
 
-        self.logger.info("=" * (len(title) + 12))
+            lines.append("=" * (len(title) + 12))
+            cached = (config, "\n".join(lines))
+            self._config_cache[key] = cached
+
+        self.logger.info(cached[1])
 
-    def _log_dict_config(self, config: Dict[str, Any], indent: int = 0):
-        """Log a dictionary configuration recursively.
+    def _render_dict_config(self, config: Dict[str, Any], lines: list, indent: int = 0):
+        """Render a dictionary configuration recursively.
 
         Args:
             config: Configuration dictionary
+            lines: Output lines to append to
             indent: Current indentation level
         """
         for key, value in config.items():
             if isinstance(value, dict):
-                self.logger.info("  " * indent + f"{key}:")
-                self._log_dict_config(value, indent + 1)
+                lines.append("  " * indent + f"{key}:")
+                self._render_dict_config(value, lines, indent + 1)
             else:
-                self.logger.info("  " * indent + f"{key}: {value}")
+                lines.append("  " * indent + f"{key}: {value}")
 
-    def _log_generic_config(self, config: Any):
-        """Log a generic configuration object.
+    def _render_generic_config(self, config: Any, lines: list):
+        """Render a generic configuration object.
 
         Args:
             config: Configuration object
+            lines: Output lines to append to
         """
         if hasattr(config, "__dict__"):
             for key, value in config.__dict__.items():
                 if not key.startswith("_"):
-                    self.logger.info(f"{key}: {value}")
+                    lines.append(f"{key}: {value}")
         else:
-            self.logger.info(str(config))
+            lines.append(str(config))
 
     def log_model_summary(
         self, model: Any, input_size: tuple, module_name: Optional[str] = None, depth: int = 3, verbose: int = 0
@@ -183,20 +207,28 @@ class TrainingLogger:
                 csv_path="logs/metrics.csv"
             )
         """
-        # Format loss string
-        loss_str = ", ".join([f"{k}: {v:.4f}" for k, v in loss_dict.items()])
-
-        # Add additional metrics if provided
-        if additional_metrics:
-            metrics_str = ", ".join([f"{k}: {v}" for k, v in additional_metrics.items()])
-            message = (
-                f"[{epoch}/{total_epochs}][{batch}/{total_batches}] {loss_str}, {metrics_str}, in {time_elapsed:.2f}s"
-            )
-        else:
-            message = f"[{epoch}/{total_epochs}][{batch}/{total_batches}] {loss_str}, in {time_elapsed:.2f}s"
-
-        # Log to console/file
-        self.logger.info(message)
+        # Only build the message when INFO will actually be emitted; the
+        # CSV write below is independent of the console/file log level
+        if self.logger.isEnabledFor(logging.INFO):
+            loss_str = ", ".join([f"{k}: {v:.4f}" for k, v in loss_dict.items()])
+
+            # %-style args defer the final formatting to the handler path
+            if additional_metrics:
+                metrics_str = ", ".join([f"{k}: {v}" for k, v in additional_metrics.items()])
+                self.logger.info(
+                    "[%d/%d][%d/%d] %s, %s, in %.2fs",
+                    epoch,
+                    total_epochs,
+                    batch,
+                    total_batches,
+                    loss_str,
+                    metrics_str,
+                    time_elapsed,
+                )
+            else:
+                self.logger.info(
+                    "[%d/%d][%d/%d] %s, in %.2fs", epoch, total_epochs, batch, total_batches, loss_str, time_elapsed
+                )
 
         # Log to CSV if requested
         if csv_path:
@@ -219,19 +251,18 @@ class TrainingLogger:
             loss_dict: Loss values
             additional_metrics: Additional metrics
         """
-        # Create directory if needed
-        ensure_dir(csv_path)
-
-        # Check if file exists
-        file_exists = os.path.isfile(csv_path)
-
         # Prepare row data
         all_metrics = {**loss_dict}
         if additional_metrics:
             all_metrics.update(additional_metrics)
 
         try:
-            with open(csv_path, mode="a", newline="", encoding="utf-8") as file:
+            entry = self._csv_files.get(csv_path)
+            if entry is None:
+                # First write for this path: open once and keep the handle
+                ensure_dir(csv_path)
+                file_exists = os.path.isfile(csv_path)
+                file = open(csv_path, mode="a", newline="", encoding="utf-8")
                 writer = csv.writer(file)
 
                 # Write header if new file
@@ -239,12 +270,32 @@ class TrainingLogger:
                     header = ["epoch", "batch"] + list(all_metrics.keys())
                     writer.writerow(header)
 
-                # Write data row
-                row = [epoch, batch] + list(all_metrics.values())
-                writer.writerow(row)
+                entry = [writer, file, 0]
+                self._csv_files[csv_path] = entry
+
+            # Write data row; the OS sees one buffered write per flush batch
+            row = [epoch, batch] + list(all_metrics.values())
+            entry[0].writerow(row)
+            entry[2] += 1
+            if entry[2] >= _CSV_FLUSH_EVERY:
+                entry[1].flush()
+                entry[2] = 0
         except Exception as e:
             self.logger.error(f"Failed to write to CSV file {csv_path}: {e}")
 
+    def close(self):
+        """Flush and close any open metrics CSV files.
+
+        Registered with atexit, so buffered rows are never lost at
+        interpreter shutdown; safe to call repeatedly.
+        """
+        files, self._csv_files = self._csv_files, {}
+        for writer, file, _ in files.values():
+            try:
+                file.close()
+            except Exception as e:
+                self.logger.error(f"Failed to close CSV file {file.name}: {e}")
+
     def log_evaluation_results(
         self, metrics: Dict[str, float], epoch: Optional[int] = None, title: str = "Evaluation Results"
     ):
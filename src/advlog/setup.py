@@ -34,23 +34,17 @@ Usage:
 import logging
 import os
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from advlog.core import LoggerManager
-from advlog.plugins import ProgressTracker
 from advlog.utils import LogNamingStrategy
 
-# Try to import Rich for console detection
-try:
-    from rich.console import Console
-
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+if TYPE_CHECKING:
+    from advlog.plugins import ProgressTracker
 
 # Global singleton instances
 _LOGGER_MANAGER: Optional[LoggerManager] = None
-_PROGRESS_TRACKER: Optional[ProgressTracker] = None
+_PROGRESS_TRACKER: Optional["ProgressTracker"] = None
 _INITIALIZED: bool = False
 _INIT_CONFIG: dict = {}
 
@@ -74,6 +68,7 @@ def initialize(
     show_location: bool = False,
     file_mode: str = "a",
     log_file: Optional[str] = None,
+    async_logging: bool = False,
 ) -> LoggerManager:
     """
     Initialize the global logging system.
@@ -93,6 +88,8 @@ def initialize(
                    If file doesn't exist, it will be created automatically.
         log_file: Specific log file path. If provided, overrides session_name-based naming.
                   This is essential for breakpoint continue - specify the exact file to append to.
+        async_logging: Route records through a background queue listener so
+                       log calls on worker threads never block on file I/O.
 
     Returns:
         LoggerManager instance
@@ -119,6 +116,17 @@ def initialize(
     """
     global _LOGGER_MANAGER, _INITIALIZED, _INIT_CONFIG
 
+    # get_logger() may already have auto-initialized with defaults - e.g.
+    # when workflow modules are imported at the top of an entry point,
+    # before the explicit initialize() call. Rebuild the manager with the
+    # requested settings and re-register the known names; register_logger
+    # reconfigures the named logging.Logger in place, so module-level
+    # logger references stay valid.
+    prior_loggers = []
+    if _LOGGER_MANAGER is not None:
+        prior_loggers = list(_LOGGER_MANAGER.loggers)
+        LoggerManager.reset()
+
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
 
@@ -156,8 +164,13 @@ def initialize(
         use_color=use_color,
         show_location=show_location,
         file_mode=file_mode,
+        async_logging=async_logging,
     )
 
+    # Re-attach loggers that existed before this call to the new handlers
+    for name in prior_loggers:
+        _LOGGER_MANAGER.register_logger(name=name, file_strategy="merged")
+
     # Store configuration for later reference
     _INIT_CONFIG = {
         "output_dir": output_dir,
@@ -168,6 +181,7 @@ def initialize(
         "show_location": show_location,
         "file_mode": file_mode,
         "log_file": log_file,
+        "async_logging": async_logging,
     }
 
     _INITIALIZED = True
@@ -224,7 +238,7 @@ def get_logger(name: str, log_level: Optional[str] = None) -> logging.Logger:
     return logger
 
 
-def get_progress() -> ProgressTracker:
+def get_progress() -> "ProgressTracker":
     """
     Get the global ProgressTracker instance.
 
@@ -242,6 +256,10 @@ def get_progress() -> ProgressTracker:
     global _PROGRESS_TRACKER
 
     if _PROGRESS_TRACKER is None:
+        # Deferred so importing advlog doesn't load Rich; it only loads the
+        # first time a progress bar is actually requested
+        from advlog.plugins import ProgressTracker
+
         _PROGRESS_TRACKER = ProgressTracker()
 
     return _PROGRESS_TRACKER
@@ -13,18 +13,26 @@
 # limitations under the License.
 
 """Shared Console utility for advlog."""
-from rich.console import Console
 import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
 
 _shared_console = None
 
-def get_shared_console() -> Console:
+def get_shared_console() -> "Console":
     """Get or create a shared Console instance.
 
+    Rich is imported here rather than at module load so importing advlog
+    stays cheap when no console output is ever requested.
+
     Returns:
         Console: A shared Console instance writing to stderr.
     """
     global _shared_console
     if _shared_console is None:
+        from rich.console import Console
+
         _shared_console = Console(file=sys.stderr)
     return _shared_console
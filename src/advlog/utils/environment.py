@@ -16,14 +16,22 @@
 
 import os
 import sys
-from typing import Any, Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
-def detect_environment() -> Dict[str, Any]:
+@lru_cache(maxsize=1)
+def detect_environment() -> Mapping[str, Any]:
     """Detect the current runtime environment.
 
+    Every probe here (platform, CI env vars, Jupyter detection, terminal
+    capabilities) is effectively invariant for the process lifetime, so the
+    result is computed once and cached; repeated callers get a read-only
+    view instead of re-running syscalls and imports.
+
     Returns:
-        Dict containing environment information:
+        Read-only mapping containing environment information:
         - platform: Operating system (windows, linux, darwin)
         - is_jupyter: Whether running in Jupyter/IPython
         - is_ci: Whether running in CI/CD environment
@@ -39,7 +47,7 @@ def detect_environment() -> Dict[str, Any]:
         "terminal_width": _get_terminal_width(),
         "is_interactive": sys.stdin.isatty() if hasattr(sys.stdin, "isatty") else False,
     }
-    return env_info
+    return MappingProxyType(env_info)
 
 
 def _is_jupyter() -> bool:
@@ -15,6 +15,10 @@
 """Path utility functions for advlog."""
 import os
 
+# Directories already created this process; repeat calls for the same log
+# directory skip the stat/mkdir syscalls entirely.
+_ENSURED_DIRS = set()
+
 def ensure_dir(path: str) -> None:
     """Ensure the directory exists for the given file path.
 
@@ -24,5 +28,6 @@ def ensure_dir(path: str) -> None:
     if not path:
         return
     dir_path = os.path.dirname(path)
-    if dir_path:
+    if dir_path and dir_path not in _ENSURED_DIRS:
         os.makedirs(dir_path, exist_ok=True)
+        _ENSURED_DIRS.add(dir_path)
@@ -13,10 +13,13 @@
 # limitations under the License.
 
 """Compatibility utilities for optional dependencies."""
-try:
-    from rich.console import Console
-    from rich.theme import Theme
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
-    Console = Theme = None
+from importlib.util import find_spec
+
+# True when Rich is installed. Availability is probed without importing
+# Rich itself; use sites import the real classes lazily when needed, so
+# importing advlog does not pay Rich's import cost.
+RICH_AVAILABLE = find_spec("rich") is not None
+
+# Annotation-only placeholders; runtime users quote the names.
+Console = None
+Theme = None
@@ -14,9 +14,12 @@
 
 """Tests for all formatter classes."""
 
+import copy
 import json
 import logging
 
+import pytest
+
 from advlog.core import (
     AlignedFormatter,
     ColumnFormatter,
@@ -28,35 +31,130 @@ from advlog.core import (
     TableFormatter,
     create_aligned_formatter,
 )
+from advlog.core.formatter import _json_dumps
+
+
+def _json_kv(key, value):
+    """Serialize one key/value pair with the formatter's active encoder.
+
+    JSONFormatter serializes through _json_dumps, which is orjson
+    (compact separators) when the perf extra is installed and stdlib
+    json otherwise. Building the expected fragment with the same encoder
+    keeps the wire-format assertions valid under both.
+
+    Args:
+        key: JSON object key
+        value: JSON object value
+
+    Returns:
+        Serialized fragment with the enclosing braces stripped
+    """
+    return _json_dumps({key: value})[1:-1]
+
+
+@pytest.fixture(scope="module")
+def base_record():
+    """One prototype LogRecord shared by the whole module.
+
+    LogRecord.__init__ reads time.time() and os.getpid() and fills ~20
+    attributes; building it once and handing out cheap copies keeps that
+    cost out of every test. Tests must mutate copies, never the prototype.
+    """
+    return logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
+
+
+def _variant(base, level=None, msg=None):
+    """Copy the prototype record, overriding level and/or message.
+
+    Args:
+        base: Prototype record from the base_record fixture
+        level: Optional level to set (levelno and levelname together)
+        msg: Optional message to set
+
+    Returns:
+        Shallow copy of the prototype with the overrides applied
+    """
+    record = copy.copy(base)
+    if level is not None:
+        record.levelno = level
+        record.levelname = logging.getLevelName(level)
+    if msg is not None:
+        record.msg = msg
+    return record
+
+
+# Attribute template for _fast_record; everything a Formatter may read
+_RECORD_TEMPLATE = {
+    "name": "test",
+    "args": (),
+    "pathname": "file.py",
+    "filename": "file.py",
+    "module": "file",
+    "exc_info": None,
+    "exc_text": None,
+    "stack_info": None,
+    "lineno": 42,
+    "funcName": "",
+    "created": 0.0,
+    "msecs": 0.0,
+    "relativeCreated": 0.0,
+    "thread": 0,
+    "threadName": "",
+    "processName": "",
+    "process": 0,
+    "taskName": None,
+}
+
+
+def _fast_record(level, msg):
+    """Build a LogRecord without running its constructor.
+
+    For tight per-iteration loops (formatter microbenchmarks), the
+    LogRecord constructor itself dominates - it calls time.time() and
+    os.getpid() per record. Allocating via object.__new__ and filling the
+    attributes from a template dict is several times cheaper and is the
+    intended helper for any benchmark added to this module.
+
+    Args:
+        level: Record level (levelno; levelname is derived)
+        msg: Record message
+
+    Returns:
+        LogRecord ready to pass to Formatter.format
+    """
+    record = object.__new__(logging.LogRecord)
+    record.__dict__.update(_RECORD_TEMPLATE)
+    record.levelno = level
+    record.levelname = logging.getLevelName(level)
+    record.msg = msg
+    return record
 
 
 class TestRichColorFormatter:
     """Test RichColorFormatter."""
 
-    def test_format_with_color(self):
+    def test_format_with_color(self, base_record):
         """Test formatting with color codes."""
         formatter = RichColorFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record))
 
         # Should contain color markup
         assert "[green]" in formatted
         assert "Test message" in formatted
 
-    def test_different_levels_different_colors(self):
+    @pytest.mark.parametrize(
+        "level,color",
+        [(logging.INFO, "green"), (logging.ERROR, "red")],
+    )
+    def test_different_levels_different_colors(self, base_record, level, color):
         """Test that different log levels get different colors."""
         formatter = RichColorFormatter()
 
-        info_record = logging.LogRecord("test", logging.INFO, "", 0, "Info", (), None)
-        error_record = logging.LogRecord("test", logging.ERROR, "", 0, "Error", (), None)
+        formatted = formatter.format(_variant(base_record, level=level))
 
-        info_formatted = formatter.format(info_record)
-        error_formatted = formatter.format(error_record)
+        assert f"[{color}]" in formatted
 
-        assert "[green]" in info_formatted
-        assert "[red]" in error_formatted
-
-    def test_custom_colors(self):
+    def test_custom_colors(self, base_record):
         """Test custom color configuration."""
         custom_colors = {
             "INFO": "blue",
@@ -64,8 +162,7 @@ class TestRichColorFormatter:
         }
         formatter = RichColorFormatter(log_colors=custom_colors)
 
-        info_record = logging.LogRecord("test", logging.INFO, "", 0, "Info", (), None)
-        info_formatted = formatter.format(info_record)
+        info_formatted = formatter.format(_variant(base_record, msg="Info"))
 
         assert "[blue]" in info_formatted
 
@@ -73,43 +170,51 @@ class TestRichColorFormatter:
 class TestPlainFormatter:
     """Test PlainFormatter."""
 
-    def test_plain_format(self):
+    def test_plain_format(self, base_record):
         """Test plain formatting without colors."""
         formatter = PlainFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record))
 
-        # Should not contain color codes
-        assert "[" not in formatted or formatted.count("[") == 0 or "[INFO]" in formatted
+        # No color markup: any bracket present must be the level tag.
+        # Two substring scans at most (the old triple-or walked the
+        # string up to three times, and the count() arm was redundant)
+        assert ("[INFO]" in formatted) or ("[" not in formatted)
         assert "Test message" in formatted
 
-    def test_default_format(self):
+    def test_default_format(self, base_record):
         """Test default format string."""
         formatter = PlainFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Test"))
 
         # Should contain timestamp, level, and message
         assert "[INFO]" in formatted
         assert "Test" in formatted
 
+    def test_custom_format_matches_stdlib(self, base_record):
+        """Test that the pre-parsed fast path matches stdlib formatting."""
+        fmt = "%(asctime)s | %(levelname)-8s | [%(filename)s:%(lineno)d] | %(message)s"
+        datefmt = "%H:%M:%S"
+        formatter = PlainFormatter(fmt=fmt, datefmt=datefmt)
+        reference = logging.Formatter(fmt=fmt, datefmt=datefmt)
+        record = _variant(base_record)
+
+        assert formatter.format(record) == reference.format(record)
+
 
 class TestIndentedFormatter:
     """Test IndentedFormatter."""
 
-    def test_single_line(self):
+    def test_single_line(self, base_record):
         """Test single line message (no indentation needed)."""
         formatter = IndentedFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Single line", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Single line"))
 
         assert "Single line" in formatted
 
-    def test_multi_line(self):
+    def test_multi_line(self, base_record):
         """Test multi-line message with indentation."""
         formatter = IndentedFormatter(indent_size=10)
-        message = "Line 1\nLine 2\nLine 3"
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, message, (), None)
+        record = _variant(base_record, msg="Line 1\nLine 2\nLine 3")
         formatted = formatter.format(record)
 
         lines = formatted.split("\n")
@@ -122,79 +227,91 @@ class TestIndentedFormatter:
 class TestJSONFormatter:
     """Test JSONFormatter."""
 
-    def test_json_format(self):
+    def test_json_format(self, base_record):
         """Test JSON formatting."""
         formatter = JSONFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record))
 
-        # Should be valid JSON
-        data = json.loads(formatted)
-        assert data["level"] == "INFO"
-        assert data["message"] == "Test message"
-        assert data["logger"] == "test"
+        # The one structural check in this class: the payload must parse
+        assert json.loads(formatted)
 
-    def test_include_extras(self):
+        # Key assertions go against the wire format directly - no parser
+        # allocation per test
+        assert _json_kv("level", "INFO") in formatted
+        assert _json_kv("message", "Test message") in formatted
+        assert _json_kv("logger", "test") in formatted
+
+    def test_include_extras(self, base_record):
         """Test including extra fields."""
         formatter = JSONFormatter(include_extras=True)
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
+        record = _variant(base_record, msg="Test")
         record.custom_field = "custom_value"
 
         formatted = formatter.format(record)
-        data = json.loads(formatted)
 
-        assert "custom_field" in data
-        assert data["custom_field"] == "custom_value"
+        assert _json_kv("custom_field", "custom_value") in formatted
 
-    def test_exclude_extras(self):
+    def test_exclude_extras(self, base_record):
         """Test excluding extra fields."""
         formatter = JSONFormatter(include_extras=False)
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
+        record = _variant(base_record, msg="Test")
         record.custom_field = "custom_value"
 
         formatted = formatter.format(record)
-        data = json.loads(formatted)
 
-        assert "custom_field" not in data
+        assert '"custom_field"' not in formatted
 
 
 class TestAlignedFormatter:
     """Test AlignedFormatter."""
 
-    def test_standard_alignment(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def default_aligned():
+        """One default-configured formatter shared by read-only tests."""
+        return AlignedFormatter()
+
+    def test_standard_alignment(self, base_record, default_aligned):
         """Test standard aligned formatting."""
-        formatter = AlignedFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
-        formatted = formatter.format(record)
+        formatted = default_aligned.format(_variant(base_record))
 
         # Should contain all fields separated by separator
         assert " | " in formatted
         assert "Test message" in formatted
 
-    def test_custom_widths(self):
+    def test_custom_widths(self, base_record):
         """Test custom field widths."""
         formatter = AlignedFormatter(time_width=20, level_width=10)
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Test"))
 
         # Time should be padded to 20 characters
         time_part = formatted.split(" | ")[0]
         assert len(time_part) == 20
 
-    def test_alignment_options(self):
+    def test_alignment_options(self, base_record):
         """Test different alignment options."""
         formatter = AlignedFormatter(align_time="center", align_level="right")
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Test"))
 
         # Just ensure it doesn't crash
         assert "Test" in formatted
 
-    def test_show_hide_fields(self):
+    def test_clone_overrides(self, base_record):
+        """Test cloning with overridden settings."""
+        base = AlignedFormatter(time_width=12, align_level="left")
+        variant = base.clone(align_level="right", level_width=10)
+
+        assert variant is not base
+        assert variant.align_level == "right"
+        assert variant.level_width == 10
+        assert base.align_level == "left"
+
+        assert "Test" in variant.format(_variant(base_record, msg="Test"))
+
+    def test_show_hide_fields(self, base_record):
         """Test showing/hiding specific fields."""
         formatter = AlignedFormatter(show_time=False, show_level=False)
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Test"))
 
         # Should only contain message (and possibly location)
         assert "Test" in formatted
@@ -203,21 +320,19 @@ class TestAlignedFormatter:
 class TestTableFormatter:
     """Test TableFormatter."""
 
-    def test_table_format(self):
+    def test_table_format(self, base_record):
         """Test table-style formatting."""
         formatter = TableFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record))
 
         # Should contain pipe separators
         assert " | " in formatted
         assert "Test message" in formatted
 
-    def test_custom_widths(self):
+    def test_custom_widths(self, base_record):
         """Test custom column widths."""
         formatter = TableFormatter(time_width=15, level_width=10)
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Test"))
 
         parts = formatted.split(" | ")
         assert len(parts) >= 2
@@ -226,59 +341,70 @@ class TestTableFormatter:
 class TestCompactFormatter:
     """Test CompactFormatter."""
 
-    def test_compact_format(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def default_compact():
+        """One default-configured formatter shared by read-only tests."""
+        return CompactFormatter()
+
+    def test_compact_format(self, base_record, default_compact):
         """Test compact formatting."""
-        formatter = CompactFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
-        formatted = formatter.format(record)
+        formatted = default_compact.format(_variant(base_record))
 
         # Should start with level in brackets
         assert "[I]" in formatted
         assert "Test message" in formatted
 
-    def test_level_character(self):
+    @pytest.mark.parametrize(
+        "level,char",
+        [(logging.INFO, "I"), (logging.WARNING, "W"), (logging.ERROR, "E")],
+    )
+    def test_level_character(self, base_record, default_compact, level, char):
         """Test single-character level indicator."""
-        formatter = CompactFormatter()
+        formatted = default_compact.format(_variant(base_record, level=level))
+
+        assert f"[{char}]" in formatted
 
-        info_record = logging.LogRecord("test", logging.INFO, "", 0, "Info", (), None)
-        warning_record = logging.LogRecord("test", logging.WARNING, "", 0, "Warning", (), None)
-        error_record = logging.LogRecord("test", logging.ERROR, "", 0, "Error", (), None)
+    def test_fast_record_formats_like_real_record(self, default_compact):
+        """Test the constructor-bypass record against a real one.
 
-        info_formatted = formatter.format(info_record)
-        warning_formatted = formatter.format(warning_record)
-        error_formatted = formatter.format(error_record)
+        Keeps _RECORD_TEMPLATE honest: if LogRecord grows an attribute a
+        formatter reads, this comparison flags the template as stale.
+        """
+        real = logging.LogRecord("test", logging.WARNING, "file.py", 42, "Bench message", (), None)
+        fast = _fast_record(logging.WARNING, "Bench message")
 
-        assert "[I]" in info_formatted
-        assert "[W]" in warning_formatted
-        assert "[E]" in error_formatted
+        assert default_compact.format(fast) == default_compact.format(real)
 
 
 class TestColumnFormatter:
     """Test ColumnFormatter."""
 
-    def test_default_columns(self):
+    @pytest.fixture(scope="class")
+    @staticmethod
+    def default_column():
+        """One default-configured formatter shared by read-only tests."""
+        return ColumnFormatter()
+
+    def test_default_columns(self, base_record, default_column):
         """Test default column configuration."""
-        formatter = ColumnFormatter()
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test message", (), None)
-        formatted = formatter.format(record)
+        formatted = default_column.format(_variant(base_record))
 
         assert "Test message" in formatted
 
-    def test_custom_columns(self):
+    def test_custom_columns(self, base_record):
         """Test custom column selection."""
         formatter = ColumnFormatter(columns=["level", "message"])
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Test"))
 
         # Should only contain level and message
         parts = formatted.split(" | ")
         assert len(parts) == 2
 
-    def test_custom_widths(self):
+    def test_custom_widths(self, base_record):
         """Test custom column widths."""
         formatter = ColumnFormatter(widths={"time": 15, "level": 10, "message": None})
-        record = logging.LogRecord("test", logging.INFO, "file.py", 42, "Test", (), None)
-        formatted = formatter.format(record)
+        formatted = formatter.format(_variant(base_record, msg="Test"))
 
         # Just ensure it doesn't crash
         assert "Test" in formatted
@@ -307,6 +433,10 @@ class TestCreateAlignedFormatter:
         formatter = create_aligned_formatter("column")
         assert isinstance(formatter, ColumnFormatter)
 
+    def test_default_instances_are_cached(self):
+        """Test that default (no-kwargs) formatters are shared."""
+        assert create_aligned_formatter("table") is create_aligned_formatter("table")
+
     def test_create_with_kwargs(self):
         """Test creating formatter with custom arguments."""
         formatter = create_aligned_formatter("standard", time_width=20)
@@ -16,8 +16,56 @@
 
 import logging
 
+import pytest
+
 from advlog.core import AdvancedLogger, LoggerConfig, LoggerManager, create_logger_group
 
+# Methods every logger returned by get_logger() must expose
+_REQUIRED_METHODS = frozenset({"debug", "info", "warning", "error", "critical"})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _quiet_root_logger():
+    """Keep stray records off stderr for the whole run.
+
+    A record that reaches the root logger with no handlers triggers the
+    lastResort stderr handler - a format() plus a write() per record
+    that contributes nothing to any assertion. A NullHandler on root
+    swallows them.
+    """
+    root = logging.getLogger()
+    handler = logging.NullHandler()
+    root.addHandler(handler)
+    yield
+    root.removeHandler(handler)
+
+
+@pytest.fixture(autouse=True)
+def _reset_registry():
+    """Drop cached logger singletons after each test.
+
+    AdvancedLogger caches instances per name and LoggerManager is a
+    process-wide singleton, so without a reset every test inherits the
+    handlers (and open file descriptors) configured by whichever earlier
+    test used the same name - the integration tests were re-wrapping a
+    TestLogger that never got its file handler. Resetting after the test,
+    not before, keeps the singleton tests themselves meaningful.
+    """
+    yield
+    AdvancedLogger.reset()
+    LoggerManager.reset()
+
+
+@pytest.fixture(scope="module")
+def log_dir(tmp_path_factory):
+    """One temporary directory shared by the file-writing tests.
+
+    A per-test TemporaryDirectory pays mkdir/teardown syscalls every
+    time; the module shares one directory and each test isolates itself
+    through unique file names.
+    """
+    return tmp_path_factory.mktemp("advlog")
+
 
 class TestAdvancedLogger:
     """Test AdvancedLogger class."""
@@ -30,42 +78,37 @@ class TestAdvancedLogger:
 
     def test_singleton_per_name(self):
         """Test that loggers with the same name are singletons."""
-        logger1 = AdvancedLogger(LoggerConfig(name="TestLogger"))
-        logger2 = AdvancedLogger(LoggerConfig(name="TestLogger"))
+        logger1 = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
+        logger2 = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
 
         assert logger1 is logger2, "Loggers with same name should be the same instance"
 
     def test_different_names(self):
         """Test that loggers with different names are different instances."""
-        logger1 = AdvancedLogger(LoggerConfig(name="Logger1"))
-        logger2 = AdvancedLogger(LoggerConfig(name="Logger2"))
+        logger1 = AdvancedLogger(LoggerConfig(name="Logger1", console_output=False))
+        logger2 = AdvancedLogger(LoggerConfig(name="Logger2", console_output=False))
 
         assert logger1 is not logger2, "Loggers with different names should be different instances"
 
     def test_get_logger(self):
         """Test that get_logger returns a logging.Logger instance."""
-        from advlog.core import AdvancedLogger
-        mock_logger = AdvancedLogger(LoggerConfig(name="TestLogger"))
+        mock_logger = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
         logger = mock_logger.get_logger()
         assert isinstance(logger, logging.Logger)
 
     def test_logging_levels(self):
         """Test logging at different levels."""
-        from advlog.core import AdvancedLogger
-        mock_logger = AdvancedLogger(LoggerConfig(name="TestLogger"))
+        mock_logger = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
         logger = mock_logger.get_logger()
 
-        # Test that methods exist
-        assert hasattr(logger, "debug")
-        assert hasattr(logger, "info")
-        assert hasattr(logger, "warning")
-        assert hasattr(logger, "error")
-        assert hasattr(logger, "critical")
+        # One bulk check instead of five hasattr probes; on failure the
+        # set difference names every missing method at once
+        missing = _REQUIRED_METHODS - set(dir(logger))
+        assert not missing, f"Logger is missing methods: {sorted(missing)}"
 
     def test_set_level(self):
         """Test changing log level."""
-        from advlog.core import AdvancedLogger
-        mock_logger = AdvancedLogger(LoggerConfig(name="TestLogger"))
+        mock_logger = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
         mock_logger.set_level("DEBUG")
         assert mock_logger._logger.level == logging.DEBUG
 
@@ -74,17 +117,17 @@ class TestAdvancedLogger:
 
     def test_reset_instance(self):
         """Test resetting a specific logger instance."""
-        logger1 = AdvancedLogger(LoggerConfig(name="TestLogger"))
+        logger1 = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
         AdvancedLogger.reset_instance("TestLogger")
 
         # Create again after reset
-        logger2 = AdvancedLogger(LoggerConfig(name="TestLogger"))
+        logger2 = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
 
         assert logger1 is not logger2, "After reset, should get a new instance"
 
     def test_get_instance(self):
         """Test getting an existing logger instance."""
-        logger1 = AdvancedLogger(LoggerConfig(name="TestLogger"))
+        logger1 = AdvancedLogger(LoggerConfig(name="TestLogger", console_output=False))
         logger2 = AdvancedLogger.get_instance("TestLogger")
 
         assert logger1 is logger2, "get_instance should return the same instance"
@@ -166,58 +209,56 @@ class TestLoggerManager:
 class TestIntegration:
     """Integration tests for logger and manager."""
 
-    def test_advanced_logger_with_file(self):
+    def test_advanced_logger_with_file(self, log_dir):
         """Test AdvancedLogger with file output."""
-        import tempfile
-        from pathlib import Path
-        with tempfile.TemporaryDirectory() as tmpdir:
-            log_file = Path(tmpdir) / "test.log"
-            logger = AdvancedLogger(
-                LoggerConfig(
-                    name="TestLogger",
-                    log_file=str(log_file),
-                    console_output=False,
-                )
-            ).get_logger()
-
-            logger.info("Test message")
-
-            assert log_file.exists(), "Log file should be created"
-            with open(log_file) as f:
-                content = f.read()
-                assert "Test message" in content
-
-    def test_multiple_loggers_separate_files(self):
+        log_file = log_dir / "advanced_logger.log"
+        logger = AdvancedLogger(
+            LoggerConfig(
+                name="TestLogger",
+                log_file=str(log_file),
+                console_output=False,
+            )
+        ).get_logger()
+
+        logger.info("Test message")
+
+        assert log_file.exists(), "Log file should be created"
+        with open(log_file) as f:
+            content = f.read()
+            assert "Test message" in content
+
+    def test_multiple_loggers_separate_files(self, log_dir):
         """Test multiple loggers writing to separate files."""
-        import tempfile
-        from pathlib import Path
-        with tempfile.TemporaryDirectory() as tmpdir:
-            logger1 = AdvancedLogger(
-                LoggerConfig(
-                    name="Logger1",
-                    log_file=str(Path(tmpdir) / "logger1.log"),
-                    console_output=False,
-                )
-            ).get_logger()
-
-            logger2 = AdvancedLogger(
-                LoggerConfig(
-                    name="Logger2",
-                    log_file=str(Path(tmpdir) / "logger2.log"),
-                    console_output=False,
-                )
-            ).get_logger()
-
-            logger1.info("Message from logger 1")
-            logger2.info("Message from logger 2")
-
-            assert (Path(tmpdir) / "logger1.log").exists()
-            assert (Path(tmpdir) / "logger2.log").exists()
-
-            with open(Path(tmpdir) / "logger1.log") as f:
-                assert "Message from logger 1" in f.read()
-                assert "Message from logger 2" not in f.read()
-
-            with open(Path(tmpdir) / "logger2.log") as f:
-                assert "Message from logger 2" in f.read()
-                assert "Message from logger 1" not in f.read()
+        file1 = log_dir / "separate_logger1.log"
+        file2 = log_dir / "separate_logger2.log"
+        logger1 = AdvancedLogger(
+            LoggerConfig(
+                name="Logger1",
+                log_file=str(file1),
+                console_output=False,
+            )
+        ).get_logger()
+
+        logger2 = AdvancedLogger(
+            LoggerConfig(
+                name="Logger2",
+                log_file=str(file2),
+                console_output=False,
+            )
+        ).get_logger()
+
+        logger1.info("Message from logger 1")
+        logger2.info("Message from logger 2")
+
+        assert file1.exists()
+        assert file2.exists()
+
+        # Read each file once: the old second f.read() hit EOF and
+        # returned "", making the negative assertion vacuously true
+        content1 = file1.read_text()
+        assert "Message from logger 1" in content1
+        assert "Message from logger 2" not in content1
+
+        content2 = file2.read_text()
+        assert "Message from logger 2" in content2
+        assert "Message from logger 1" not in content2